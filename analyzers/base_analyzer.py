@@ -6,10 +6,13 @@ Classe base astratta per tutti gli analizzatori specializzati
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional
 import statistics
+import math
 import re
 
+from utils.text_utils import split_sentences
+
 
 class BaseAnalyzer(ABC):
     """
@@ -151,6 +154,32 @@ class BaseAnalyzer(ABC):
         normalized = (value - min_val) / (max_val - min_val)
         return max(0.0, min(1.0, normalized))
 
+    def _count_mean_stdev(self, counts) -> Tuple[float, float]:
+        """
+        Media e deviazione standard campionaria di conteggi interi.
+
+        Una sola passata: somma e somma dei quadrati restano interi esatti,
+        quindi il risultato coincide con statistics.mean/stdev.
+
+        Args:
+            counts: Sequenza o iterabile di interi
+
+        Returns:
+            Tuple (mean, stdev); stdev = 0.0 con meno di due valori
+        """
+        n = total = total_sq = 0
+        for x in counts:
+            n += 1
+            total += x
+            total_sq += x * x
+
+        if n == 0:
+            return 0.0, 0.0
+        mean = total / n
+        if n < 2:
+            return mean, 0.0
+        return mean, math.sqrt((n * total_sq - total * total) / (n * (n - 1)))
+
     def _get_word_count(self, text: str) -> int:
         """Conta parole in un testo."""
         return len(re.findall(r'\b\w+\b', text))
@@ -160,6 +189,10 @@ class BaseAnalyzer(ABC):
         sentences = re.findall(r'[.!?]+', text)
         return len(sentences)
 
+    def _split_sentences(self, text: str) -> List[str]:
+        """Frasi non vuote del testo, già ripulite dagli spazi."""
+        return split_sentences(text)
+
     def _get_paragraph_count(self, text: str) -> int:
         """Conta paragrafi in un testo."""
         paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
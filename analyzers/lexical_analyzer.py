@@ -49,8 +49,7 @@ class LexicalAnalyzer(BaseAnalyzer):
         # Frequenze per burstiness
         freq = Counter(words)
         frequencies = list(freq.values())
-        mean_freq = statistics.mean(frequencies) if frequencies else 0
-        std_freq = statistics.stdev(frequencies) if len(frequencies) > 1 else 0
+        mean_freq, std_freq = self._count_mean_stdev(frequencies)
 
         burstiness = 0
         if mean_freq > 0:
@@ -6,8 +6,6 @@ Analizzatore specializzato in metriche semantiche
 """
 
 from typing import Dict, Any, Tuple
-import re
-import statistics
 from .base_analyzer import BaseAnalyzer
 
 
@@ -46,8 +44,7 @@ class SemanticAnalyzer(BaseAnalyzer):
         concept_diversity = unique_concepts / len(content_words) if content_words else 0
 
         # Coerenza tematica (condivisione parole tra frasi)
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = self._split_sentences(text)
 
         sentence_word_sets = [set(s.lower().split()) for s in sentences]
         overlaps = []
@@ -55,15 +52,10 @@ class SemanticAnalyzer(BaseAnalyzer):
             overlap = len(sentence_word_sets[i] & sentence_word_sets[i+1])
             overlaps.append(overlap)
 
-        avg_overlap = statistics.mean(overlaps) if overlaps else 0
+        # Topic consistency (variazione overlap): media e deviazione in una passata
+        avg_overlap, overlap_variability = self._count_mean_stdev(overlaps)
         max_overlap = max(overlaps) if overlaps else 0
 
-        # Topic consistency (variazione overlap)
-        if len(overlaps) > 1:
-            overlap_variability = statistics.stdev(overlaps)
-        else:
-            overlap_variability = 0
-
         metrics = {
             'subjectivity': round(subjectivity, 4),
             'conceptual_density': round(conceptual_density, 4),
@@ -42,15 +42,11 @@ class StylisticAnalyzer(BaseAnalyzer):
         upper_ratio = upper_chars / total_chars if total_chars > 0 else 0
 
         # Pattern di punteggiatura
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = self._split_sentences(text)
 
         # Variazione punteggiatura nelle frasi
         punct_per_sentence = [len(re.findall(r'[.,;:!?]', s)) for s in sentences]
-        if len(punct_per_sentence) > 1:
-            punct_variability = statistics.stdev(punct_per_sentence)
-        else:
-            punct_variability = 0
+        avg_punct, punct_variability = self._count_mean_stdev(punct_per_sentence)
 
         # Ripetitività espressioni
         common_phrases = re.findall(r'\b\w+\s+\w+\s+\w+\b', text.lower())
@@ -84,7 +80,7 @@ class StylisticAnalyzer(BaseAnalyzer):
             'quote_count': quotes,
             'paragraph_count': len(paragraphs),
             'avg_paragraph_length': round(avg_paragraph_length, 2),
-            'avg_punct_per_sentence': round(statistics.mean(punct_per_sentence), 2) if punct_per_sentence else 0
+            'avg_punct_per_sentence': round(avg_punct, 2)
         }
 
         # Confidence basata su variabilità punteggiatura
@@ -7,8 +7,6 @@ Analizzatore specializzato in metriche sintattiche
 
 from typing import Dict, Any, Tuple
 from collections import Counter
-import re
-import statistics
 from .base_analyzer import BaseAnalyzer
 
 
@@ -33,19 +31,15 @@ class SyntacticAnalyzer(BaseAnalyzer):
         self._validate_input(text)
 
         # Lunghezza frasi
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = self._split_sentences(text)
 
-        sentence_lengths = [len(s.split()) for s in sentences]
+        # Una sola tokenizzazione per frase, riusata per lunghezze e pattern
+        sentence_words = [s.split() for s in sentences]
+        sentence_lengths = [len(words) for words in sentence_words]
 
-        # Variabilità lunghezza frasi
-        if len(sentence_lengths) > 1:
-            avg_length = statistics.mean(sentence_lengths)
-            std_length = statistics.stdev(sentence_lengths)
-            variability = std_length / avg_length if avg_length > 0 else 0
-        else:
-            variability = 0.0
-            avg_length = sentence_lengths[0] if sentence_lengths else 0
+        # Variabilità lunghezza frasi (media e deviazione in una sola passata)
+        avg_length, std_length = self._count_mean_stdev(sentence_lengths)
+        variability = std_length / avg_length if avg_length > 0 else 0.0
 
         # Min/Max sentence length
         min_length = min(sentence_lengths) if sentence_lengths else 0
@@ -53,11 +47,10 @@ class SyntacticAnalyzer(BaseAnalyzer):
 
         # Pattern ripetitivi (frasi con struttura simile)
         pattern_scores = []
-        for sent in sentences[:10]:  # Analizza max 10 frasi
-            words = sent.lower().split()
+        for words in sentence_words[:10]:  # Analizza max 10 frasi
             if len(words) > 3:
                 # Similitudine pattern (primo, ultimo, medio)
-                pattern = (words[0], words[-1], words[len(words)//2])
+                pattern = (words[0].lower(), words[-1].lower(), words[len(words)//2].lower())
                 pattern_scores.append(pattern)
 
         # Rileva pattern ripetitivi
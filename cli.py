@@ -7,15 +7,49 @@ Interfaccia a riga di comando per TextAnalyzer
 
 import sys
 import os
-sys.path.insert(0, '/home/martina/PycharmProjects/TextAnalyzer')
-
 import argparse
-from typing import Optional
-from core.text_analyzer import TextAnalyzer
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional, Dict, Any, List, Tuple
+
+from utils.worker_pool import init_worker_analyzer, get_worker_analyzer
+
+# Lo stack di analisi (numpy, sklearn, analyzers) è importato solo dai comandi
+# che lo usano: --help e gli errori di argparse restano immediati
+
+
+def _analyze_one(filepath: str) -> Tuple[Dict[str, Any], Tuple[int, int]]:
+    """Analizza un file nel processo worker: (riga del report, (pid, voci in cache))"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    analyzer = get_worker_analyzer()
+    result = analyzer.analyze(text)
+    return {
+        'filename': os.path.basename(filepath),
+        'classification': result.classification,
+        'ai_probability': result.ai_probability,
+        'confidence': result.confidence,
+        'processing_time_ms': result.processing_time_ms
+    }, (os.getpid(), len(analyzer.cache) if analyzer.cache else 0)
+
+
+def _batch_stats(stats: Dict[str, Any], results: List[Dict[str, Any]],
+                 worker_caches: Dict[int, int]) -> Dict[str, Any]:
+    """Statistiche del batch dai risultati dei worker (l'analyzer del padre non analizza)"""
+    n = len(results)
+    return {
+        **stats,
+        'total_analyses': n,
+        'avg_processing_time': sum(r['processing_time_ms'] for r in results) / n if n else 0.0,
+        'avg_confidence': sum(r['confidence'] for r in results) / n if n else 0.0,
+        'cache_size': sum(worker_caches.values())
+    }
 
 
 def analyze_text(text: str, output: Optional[str] = None, calibrate: bool = False):
     """Analizza un testo e stampa risultati"""
+    from core.text_analyzer import TextAnalyzer
+
     print("🧠 TextAnalyzer CLI v3.0")
     print("=" * 70)
 
@@ -111,6 +145,7 @@ def batch_analyze(folder: str, output: Optional[str] = None, calibrate: bool = F
 
     print(f"📁 Found {len(txt_files)} .txt files in {folder}")
 
+    from core.text_analyzer import TextAnalyzer
     analyzer = TextAnalyzer(auto_calibrate=False, debug=False)
 
     if calibrate:
@@ -119,35 +154,48 @@ def batch_analyze(folder: str, output: Optional[str] = None, calibrate: bool = F
         if result['success']:
             print(f"✅ Calibration successful!")
 
-    results = []
-    for i, filename in enumerate(txt_files, 1):
-        filepath = os.path.join(folder, filename)
-        print(f"\n[{i}/{len(txt_files)}] Analyzing {filename}...")
-
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                text = f.read()
-
-            result = analyzer.analyze(text)
-            results.append({
-                'filename': filename,
-                'classification': result.classification,
-                'ai_probability': result.ai_probability,
-                'confidence': result.confidence
-            })
-
-            print(f"   → {result.classification} (AI: {result.ai_probability:.3f})")
-
-        except Exception as e:
-            print(f"   ❌ Error: {str(e)}")
+    # I file sono indipendenti e l'analisi è CPU-bound: un processo per core
+    paths = [os.path.join(folder, filename) for filename in txt_files]
+    calibration = {
+        'is_calibrated': analyzer.is_calibrated,
+        'calibration_threshold': analyzer.calibration_threshold
+    }
+    workers = min(os.cpu_count() or 1, len(paths))
+
+    results_by_index = {}
+    worker_caches = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker_analyzer,
+                             initargs=(TextAnalyzer, {'auto_calibrate': False, 'debug': False},
+                                       calibration)) as executor:
+        futures = {executor.submit(_analyze_one, path): i for i, path in enumerate(paths)}
+        for done, future in enumerate(as_completed(futures), 1):
+            index = futures[future]
+            filename = txt_files[index]
+            print(f"\n[{done}/{len(txt_files)}] Analyzed {filename}")
+            try:
+                result, (pid, cache_size) = future.result()
+            except Exception as e:
+                print(f"   ❌ Error: {str(e)}")
+                continue
+            results_by_index[index] = result
+            # Dimensione più recente della cache di ciascun worker
+            worker_caches[pid] = max(worker_caches.get(pid, 0), cache_size)
+            print(f"   → {result['classification']} (AI: {result['ai_probability']:.3f})")
+
+    # Ordine dei risultati = ordine dei file
+    results = [results_by_index[i] for i in sorted(results_by_index)]
+    stats = _batch_stats(analyzer.get_stats(), results, worker_caches)
+
+    print(f"\n📊 Analyzed {stats['total_analyses']}/{len(txt_files)} files "
+          f"(avg {stats['avg_processing_time']:.2f}ms, confidence {stats['avg_confidence']:.3f})")
 
     # Export batch results
     if output:
         import json
-        os.makedirs(os.path.dirname(output), exist_ok=True)
+        os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
         with open(output, 'w', encoding='utf-8') as f:
             json.dump({
-                'timestamp': analyzer.get_stats(),
+                'timestamp': stats,
                 'results': results
             }, f, indent=2)
 
@@ -158,6 +206,7 @@ def batch_analyze(folder: str, output: Optional[str] = None, calibrate: bool = F
 
 def show_stats():
     """Mostra statistiche sistema"""
+    from core.text_analyzer import TextAnalyzer
     analyzer = TextAnalyzer()
 
     print("📊 TextAnalyzer Statistics")
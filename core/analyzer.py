@@ -8,13 +8,25 @@ import os
 import json
 import pickle
 import statistics
-from typing import Dict, List, Any, Tuple
+import multiprocessing
+from collections import Counter
+from typing import Dict, List, Any, Tuple, Iterator
 from datetime import datetime
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from core.text_processor import TextProcessor
 from features.feature_extractor import FeatureExtractor
 from utils.data_loader import DataLoader
 from utils.evaluator import ModelEvaluator
+from utils.worker_pool import init_worker_analyzer, get_worker_analyzer
+
+# Sentinella condivisa (sola lettura) per le sezioni mancanti dei risultati:
+# evita di allocare un dict vuoto a ogni lookup
+_EMPTY: Dict[str, Any] = {}
 
 
 class TextAnalyzer:
@@ -27,6 +39,7 @@ class TextAnalyzer:
         self.evaluator = ModelEvaluator()
         
         # Inizializza modello (se disponibile)
+        self.model_path = model_path
         self.model = None
         self.scaler = None
         self.feature_names = []
@@ -111,80 +124,110 @@ class TextAnalyzer:
         except Exception as e:
             return {'error': f'Errore nella lettura del file: {str(e)}'}
 
-    def batch_analyze(self, directory: str, file_pattern: str = "*.txt") -> List[Dict[str, Any]]:
-        """Analizza multiple files in una directory"""
-        results = []
+    def batch_analyze(self, directory: str, file_pattern: str = "*.txt",
+                      processes: int = None) -> List[Dict[str, Any]]:
+        """Analizza multiple files in una directory
+        
+        I file sono documenti indipendenti: con più di un file l'analisi viene
+        distribuita su un pool di processi (uno per core, salvo `processes`),
+        ognuno con il proprio TextAnalyzer configurato come questo (pattern e
+        modello, vedi _batch_worker_state). L'ordine dei risultati segue
+        quello dei file.
+        """
         files = self.data_loader.load_files_from_directory(directory, file_pattern)
+        workers = min(processes or os.cpu_count() or 1, len(files))
         
-        for file_path in files:
-            result = self.analyze_file(file_path)
-            result['file_path'] = file_path
-            results.append(result)
+        if workers <= 1:
+            results = []
+            for file_path in files:
+                result = self.analyze_file(file_path)
+                result['file_path'] = file_path
+                results.append(result)
+            return results
         
-        return results
+        with multiprocessing.Pool(workers, initializer=init_worker_analyzer,
+                                  initargs=(TextAnalyzer, None, self._batch_worker_state())) as pool:
+            return list(pool.imap(_analyze_file_in_worker, files, chunksize=4))
 
-    def generate_report(self, results: List[Dict[str, Any]], output_path: str = None) -> str:
-        """Genera un report dettagliato dell'analisi"""
+    def _batch_worker_state(self) -> Dict[str, Any]:
+        """Configurazione da riportare negli analyzer dei worker batch"""
+        return {
+            'model_path': self.model_path,
+            'model': self.model,
+            'scaler': self.scaler,
+            'feature_names': self.feature_names,
+            'known_patterns': self.known_patterns
+        }
+
+    def generate_report_iter(self, results: List[Dict[str, Any]]) -> Iterator[str]:
+        """Genera il report riga per riga, senza costruire la stringa completa"""
         if not results:
-            return "Nessun risultato da analizzare."
+            yield "Nessun risultato da analizzare."
+            return
         
-        report = []
-        report.append("=" * 80)
-        report.append("REPORT ANALISI TESTI AI vs UMANI")
-        report.append("=" * 80)
-        report.append(f"Data analisi: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append(f"Numero di testi analizzati: {len(results)}")
-        report.append("")
+        yield "=" * 80
+        yield "REPORT ANALISI TESTI AI vs UMANI"
+        yield "=" * 80
+        yield f"Data analisi: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        yield f"Numero di testi analizzati: {len(results)}"
+        yield ""
         
         # Statistiche generali
-        ai_count = sum(1 for r in results if r.get('final_assessment', {}).get('prediction') == 'AI')
-        human_count = sum(1 for r in results if r.get('final_assessment', {}).get('prediction') == 'UMANO')
+        predictions = Counter((r.get('final_assessment') or _EMPTY).get('prediction') for r in results)
+        ai_count = predictions['AI']
+        human_count = predictions['UMANO']
         
-        report.append("STATISTICHE GENERALI:")
-        report.append(f"  Testi identificati come AI: {ai_count} ({ai_count/len(results)*100:.1f}%)")
-        report.append(f"  Testi identificati come Umani: {human_count} ({human_count/len(results)*100:.1f}%)")
-        report.append("")
+        yield "STATISTICHE GENERALI:"
+        yield f"  Testi identificati come AI: {ai_count} ({ai_count/len(results)*100:.1f}%)"
+        yield f"  Testi identificati come Umani: {human_count} ({human_count/len(results)*100:.1f}%)"
+        yield ""
         
         # Dettagli per ogni testo
-        report.append("DETTAGLI ANALISI:")
-        report.append("-" * 80)
+        yield "DETTAGLI ANALISI:"
+        yield "-" * 80
         
         for i, result in enumerate(results, 1):
-            report.append(f"\n{i}. {result.get('file_name', 'File sconosciuto')}")
+            yield f"\n{i}. {result.get('file_name', 'File sconosciuto')}"
             
             if 'error' in result:
-                report.append(f"   ERRORE: {result['error']}")
+                yield f"   ERRORE: {result['error']}"
                 continue
             
-            assessment = result.get('final_assessment', {})
+            assessment = result.get('final_assessment') or _EMPTY
             prediction = assessment.get('prediction', 'Sconosciuto')
             confidence = assessment.get('confidence', 0)
             
-            report.append(f"   Classificazione: {prediction}")
-            report.append(f"   Confidenza: {confidence:.1%}")
+            yield f"   Classificazione: {prediction}"
+            yield f"   Confidenza: {confidence:.1%}"
             
             # Metriche chiave
-            features = result.get('features', {})
-            lexical = features.get('lexical', {})
-            syntactic = features.get('syntactic', {})
+            features = result.get('features') or _EMPTY
+            lexical = features.get('lexical') or _EMPTY
+            syntactic = features.get('syntactic') or _EMPTY
+            style = features.get('style') or _EMPTY
             
-            report.append(f"   Diversità lessicale: {lexical.get('lexical_diversity', 0):.3f}")
-            report.append(f"   Lunghezza media frase: {syntactic.get('avg_sentence_length', 0):.1f} parole")
-            report.append(f"   Consistenza stilistica: {features.get('style', {}).get('stylistic_consistency', 0):.3f}")
+            yield f"   Diversità lessicale: {lexical.get('lexical_diversity', 0):.3f}"
+            yield f"   Lunghezza media frase: {syntactic.get('avg_sentence_length', 0):.1f} parole"
+            yield f"   Consistenza stilistica: {style.get('stylistic_consistency', 0):.3f}"
         
         # Analisi comparativa
         if len(results) > 1:
-            report.append("\n" + "=" * 80)
-            report.append("ANALISI COMPARATIVA")
-            report.append("=" * 80)
+            yield "\n" + "=" * 80
+            yield "ANALISI COMPARATIVA"
+            yield "=" * 80
             
-            self._add_comparative_analysis(report, results)
-        
-        report_text = "\n".join(report)
+            yield from self._iter_comparative_analysis(results)
+
+    def generate_report(self, results: List[Dict[str, Any]], output_path: str = None) -> str:
+        """Genera un report dettagliato dell'analisi"""
+        report_text = "\n".join(self.generate_report_iter(results))
+        if not results:
+            return report_text
         
         if output_path:
             try:
-                with open(output_path, 'w', encoding='utf-8') as f:
+                with open(output_path, 'w', encoding='utf-8',
+                          buffering=self.data_loader.write_buffer_size) as f:
                     f.write(report_text)
                 print(f"Report salvato in: {output_path}")
             except Exception as e:
@@ -334,36 +377,39 @@ class TextAnalyzer:
             'ml_used': ml_pred is not None
         }
 
-    def _add_comparative_analysis(self, report: List[str], results: List[Dict[str, Any]]):
-        """Aggiunge analisi comparativa al report"""
-        # Raccogli features per analisi
-        all_features = {}
+    def _iter_comparative_analysis(self, results: List[Dict[str, Any]]) -> Iterator[str]:
+        """Genera le righe dell'analisi comparativa del report"""
+        # Raccogli le features per colonna (una sequenza di valori per feature),
+        # solo valori numerici: i metadati come il timestamp non sono aggregabili
+        columns = {}
         for result in results:
             if 'error' not in result:
-                features = result.get('features', {})
+                features = result.get('features') or _EMPTY
                 for category, feature_dict in features.items():
                     if isinstance(feature_dict, dict):
                         for name, value in feature_dict.items():
-                            if name not in all_features:
-                                all_features[name] = []
-                            all_features[name].append(value)
+                            if isinstance(value, (int, float)):
+                                columns.setdefault(name, []).append(value)
         
         # Statistiche comparative
-        report.append("METRICHE COMPARATIVE:")
-        for feature_name, values in all_features.items():
+        yield "METRICHE COMPARATIVE:"
+        for feature_name, values in columns.items():
             if len(values) > 1:
-                mean_val = statistics.mean(values)
-                std_val = statistics.stdev(values) if len(values) > 1 else 0
-                report.append(f"  {feature_name}: μ={mean_val:.3f}, σ={std_val:.3f}")
+                if np is not None:
+                    column = np.asarray(values, dtype=np.float64)
+                    mean_val, std_val = column.mean(), column.std(ddof=1)
+                else:
+                    mean_val, std_val = statistics.mean(values), statistics.stdev(values)
+                yield f"  {feature_name}: μ={mean_val:.3f}, σ={std_val:.3f}"
         
         # Identificazione outlier
-        report.append("\nOUTLIER IDENTIFICATI:")
+        yield "\nOUTLIER IDENTIFICATI:"
         for result in results:
             if 'error' not in result:
-                assessment = result.get('final_assessment', {})
+                assessment = result.get('final_assessment') or _EMPTY
                 confidence = assessment.get('confidence', 0)
                 if confidence < 0.6:  # Bassa confidence
-                    report.append(f"  - {result.get('file_name', 'File sconosciuto')}: confidence {confidence:.1%}")
+                    yield f"  - {result.get('file_name', 'File sconosciuto')}: confidence {confidence:.1%}"
 
     def _load_model(self, model_path: str):
         """Carica modello ML salvato"""
@@ -379,3 +425,13 @@ class TextAnalyzer:
             self.model = None
             self.scaler = None
             self.feature_names = []
+
+
+# ----- BATCH MULTIPROCESSO -----
+# Funzioni a livello di modulo per essere serializzabili dal pool
+
+def _analyze_file_in_worker(file_path: str) -> Dict[str, Any]:
+    """Analizza un file nel processo worker"""
+    result = get_worker_analyzer().analyze_file(file_path)
+    result['file_path'] = file_path
+    return result
@@ -6,6 +6,7 @@ Sistema di ensemble learning con 5 analizzatori specializzati
 Include: Majority Voting, Weighted Voting, Confidence Aggregation
 """
 
+import re
 import statistics
 import numpy as np
 from typing import Dict, List, Any, Tuple, Optional
@@ -15,7 +16,9 @@ import os
 from datetime import datetime
 
 # Import degli analizzatori base (disponibili nel progetto)
-# Il sistema ensemble è autonomo e non dipende da altri analyzer
+# Il sistema ensemble è autonomo e non dipende da altri analyzer:
+# condivide solo lo splitter di frasi (utils, senza dipendenze)
+from utils.text_utils import split_sentences
 
 
 class LexicalAnalyzer:
@@ -99,8 +102,7 @@ class SyntacticAnalyzer:
         import re
 
         # Lunghezza frasi
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = split_sentences(text)
 
         sentence_lengths = [len(s.split()) for s in sentences]
 
@@ -178,8 +180,7 @@ class SemanticAnalyzer:
         conceptual_density = complex_words / len(words) if words else 0
 
         # Coerenza tematica (condivisione parole tra frasi)
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = split_sentences(text)
 
         sentence_word_sets = [set(s.lower().split()) for s in sentences]
         overlaps = []
@@ -242,8 +243,7 @@ class StylisticAnalyzer:
         upper_ratio = upper_chars / total_chars if total_chars > 0 else 0
 
         # Pattern di punteggiatura
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = split_sentences(text)
 
         # Variazione punteggiatura nelle frasi
         punct_per_sentence = [len(re.findall(r'[.,;:!?]', s)) for s in sentences]
@@ -62,31 +62,10 @@ class EnsembleEngine:
 
         # Run analysis with each analyzer
         for analyzer in self.analyzers:
-            try:
-                metrics = analyzer.analyze(text)
-                ai_prob, human_prob = analyzer.predict(metrics)
-
-                individual_results[analyzer.name] = {
-                    'metrics': metrics,
-                    'ai_probability': ai_prob,
-                    'human_probability': human_prob,
-                    'confidence': metrics.get('confidence', 0.5)
-                }
-
-                predictions.append({
-                    'analyzer': analyzer.name,
-                    'ai_prob': ai_prob,
-                    'human_prob': human_prob,
-                    'confidence': metrics.get('confidence', 0.5)
-                })
-
-            except Exception as e:
-                individual_results[analyzer.name] = {
-                    'error': str(e),
-                    'ai_probability': 0.5,
-                    'human_probability': 0.5,
-                    'confidence': 0.0
-                }
+            entry, prediction = self._run_analyzer(analyzer, text)
+            individual_results[analyzer.name] = entry
+            if prediction is not None:
+                predictions.append(prediction)
 
         # Aggregate results
         ensemble_result = self._aggregate_predictions(predictions)
@@ -109,6 +88,33 @@ class EnsembleEngine:
             'analyzer_count': len(self.analyzers)
         }
 
+    def _run_analyzer(self, analyzer, text: str) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Esegue un singolo analyzer: (risultato individuale, prediction o None se errore)"""
+        try:
+            metrics = analyzer.analyze(text)
+            ai_prob, human_prob = analyzer.predict(metrics)
+        except Exception as e:
+            return {
+                'error': str(e),
+                'ai_probability': 0.5,
+                'human_probability': 0.5,
+                'confidence': 0.0
+            }, None
+
+        entry = {
+            'metrics': metrics,
+            'ai_probability': ai_prob,
+            'human_probability': human_prob,
+            'confidence': metrics.get('confidence', 0.5)
+        }
+        prediction = {
+            'analyzer': analyzer.name,
+            'ai_prob': ai_prob,
+            'human_prob': human_prob,
+            'confidence': metrics.get('confidence', 0.5)
+        }
+        return entry, prediction
+
     def _aggregate_predictions(self, predictions: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Aggrega predictions con weighted voting"""
 
@@ -5,15 +5,14 @@ TextAnalyzer Core Engine
 Facade principale per analisi testuale AI vs Human
 """
 
-import sys
 import os
-sys.path.insert(0, '/home/martina/PycharmProjects/TextAnalyzer')
+import gzip
+import hashlib
 
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
 from datetime import datetime
-import json
-
 # Import analyzers
 from analyzers import (
     create_default_ensemble,
@@ -25,6 +24,8 @@ from analyzers import (
 # Import utils
 from utils.input_validator import InputValidator
 from utils.confidence_metrics import ConfidenceMetrics
+from utils.result_cache import ResultCache
+from utils.data_loader import dumps_json
 
 
 @dataclass
@@ -61,10 +62,18 @@ class TextAnalyzer:
         print(f"AI Probability: {result.ai_probability:.4f}")
     """
 
+    EXPORT_BUFFER_SIZE = 1024 * 1024  # 1MB
+    # Oltre questa dimensione l'export viene compresso automaticamente (.gz)
+    EXPORT_COMPRESS_THRESHOLD = 1024 * 1024  # 1MB
+    CACHE_MAX_ENTRIES = 32
+    # Da incrementare quando cambia la logica di analisi: invalida la cache su disco
+    ENGINE_VERSION = "3.0"
+
     def __init__(self,
                  auto_calibrate: bool = False,
                  enable_cache: bool = True,
-                 debug: bool = False):
+                 debug: bool = False,
+                 persistent_cache: bool = False):
         """
         Inizializza TextAnalyzer.
 
@@ -72,6 +81,8 @@ class TextAnalyzer:
             auto_calibrate: Se True, calibra automaticamente al primo uso
             enable_cache: Se True, abilita caching risultati
             debug: Se True, abilita logging debug
+            persistent_cache: Se True, conserva i risultati anche su disco
+                (SQLite) tra sessioni diverse
         """
         # Components
         self.validator = InputValidator()
@@ -89,7 +100,9 @@ class TextAnalyzer:
         # State
         self.is_calibrated = False
         self.calibration_threshold = 0.5
-        self.cache = {} if enable_cache else None
+        # Cache LRU limitata: testo -> AnalysisResult
+        self.cache = OrderedDict() if enable_cache else None
+        self.result_cache = ResultCache() if enable_cache and persistent_cache else None
 
         # Stats
         self.stats = {
@@ -107,6 +120,12 @@ class TextAnalyzer:
         """
         Analizza un testo e determina se è AI o umano.
 
+        Un risultato dalla cache (in memoria o su disco) è restituito così
+        com'è stato calcolato: processing_time_ms e timestamp si riferiscono
+        all'analisi originale e le statistiche non vengono aggiornate, perché
+        contano solo le analisi effettivamente eseguite. Una voce su disco
+        illeggibile o incompatibile vale come miss e viene rimossa.
+
         Args:
             text: Testo da analizzare (min 10 caratteri)
 
@@ -120,11 +139,25 @@ class TextAnalyzer:
 
         # Check cache
         cache_key = self._get_cache_key(text)
-        if self.cache and cache_key in self.cache:
+        if self.cache is not None and cache_key in self.cache:
             if self.debug:
                 print("📦 Returning cached result")
+            self.cache.move_to_end(cache_key)
             return self.cache[cache_key]
 
+        if self.result_cache is not None:
+            cached = self.result_cache.get(cache_key, self._result_cache_version())
+            if cached is not None:
+                try:
+                    result = AnalysisResult(**cached)
+                except TypeError:
+                    # Campi di AnalysisResult cambiati senza bump di ENGINE_VERSION:
+                    # la voce non è più valida, si rianalizza
+                    self.result_cache.discard(cache_key)
+                else:
+                    self._remember(cache_key, result)
+                    return result
+
         # Validate input
         validation = self.validator.validate_text(text)
         if not validation['valid']:
@@ -172,11 +205,25 @@ class TextAnalyzer:
         self._update_stats(result)
 
         # Cache
-        if self.cache:
-            self.cache[cache_key] = result
+        self._remember(cache_key, result)
+        if self.result_cache is not None:
+            self.result_cache.put(cache_key, self._result_cache_version(), asdict(result))
 
         return result
 
+    def _remember(self, cache_key: str, result: AnalysisResult):
+        """Inserisce un risultato nella cache LRU in memoria."""
+        if self.cache is not None:
+            self.cache[cache_key] = result
+            if len(self.cache) > self.CACHE_MAX_ENTRIES:
+                self.cache.popitem(last=False)
+
+    def _result_cache_version(self) -> str:
+        """Versione del motore per la cache su disco (pesi e calibrazione inclusi)."""
+        weights = ",".join(f"{name}={weight}" for name, weight in sorted(self.ensemble.weights.items()))
+        calibration = f"{self.calibration_threshold:.6f}" if self.is_calibrated else "raw"
+        return f"{self.ENGINE_VERSION}|{weights}|{calibration}"
+
     def analyze_batch(self, texts: List[str]) -> List[AnalysisResult]:
         """
         Analizza una lista di testi.
@@ -234,6 +281,10 @@ class TextAnalyzer:
 
             self.is_calibrated = True
             self.calibration_threshold = result.best_thresholds.get('ai_threshold', 0.5)
+            # I risultati in memoria usano la classificazione pre-calibrazione
+            # (quelli su disco sono già separati dalla versione di cache)
+            if self.cache is not None:
+                self.cache.clear()
 
             if self.debug:
                 print(f"✅ Calibration complete")
@@ -282,18 +333,27 @@ class TextAnalyzer:
 
     def clear_cache(self):
         """Pulisce la cache."""
-        if self.cache:
+        if self.result_cache is not None:
+            self.result_cache.clear()
+        if self.cache is not None:
             self.cache.clear()
             if self.debug:
                 print("🧹 Cache cleared")
 
-    def export_result(self, result: AnalysisResult, filepath: str):
+    def export_result(self, result: AnalysisResult, filepath: str,
+                      compress: Optional[bool] = None) -> str:
         """
         Esporta risultato in file JSON.
 
         Args:
             result: AnalysisResult da esportare
             filepath: Path del file di output
+            compress: True/False per forzare o escludere la compressione gzip;
+                None la attiva se il JSON supera EXPORT_COMPRESS_THRESHOLD
+                (o se filepath termina con .gz)
+
+        Returns:
+            Path effettivo del file scritto (con suffisso .gz se compresso)
         """
         # Convert dataclass to dict
         result_dict = {
@@ -311,18 +371,32 @@ class TextAnalyzer:
             'timestamp': result.timestamp
         }
 
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(result_dict, f, indent=2, ensure_ascii=False, default=str)
+        # Serializzazione completa in memoria: la dimensione decide la compressione
+        payload = dumps_json(result_dict)
+
+        if compress is None:
+            compress = filepath.endswith('.gz') or len(payload) > self.EXPORT_COMPRESS_THRESHOLD
+        if compress and not filepath.endswith('.gz'):
+            filepath += '.gz'
+
+        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+        with open(filepath, 'wb', buffering=self.EXPORT_BUFFER_SIZE) as f:
+            if compress:
+                # Livello 1: quasi tutto il guadagno di spazio al costo minimo
+                with gzip.GzipFile(fileobj=f, mode='wb', compresslevel=1) as gz:
+                    gz.write(payload)
+            else:
+                f.write(payload)
 
         if self.debug:
             print(f"💾 Result exported to {filepath}")
+        return filepath
 
     def _get_cache_key(self, text: str) -> str:
         """Genera chiave cache per un testo."""
-        # Simple hash based on first/last 100 chars and length
-        text_sample = text[:100] + text[-100:] if len(text) > 200 else text
-        return f"{len(text)}:{hash(text_sample)}"
+        # Digest dell'intero testo: un campione (inizio/fine) farebbe
+        # collidere testi che differiscono solo nella parte centrale
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
 
     def _update_stats(self, result: AnalysisResult):
         """Aggiorna statistiche interne."""
@@ -7,12 +7,16 @@ Modulo per la pulizia e preparazione del testo
 import re
 import string
 import unicodedata
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 
 
 class TextProcessor:
     """Processore di testo per analisi avanzate"""
     
+    # Documenti interi tenuti in cache per istanza (tokenize e split_sentences)
+    CACHE_MAX_DOCUMENTS = 8
+    
     def __init__(self):
         # Pattern per la pulizia del testo
         self.cleaning_patterns = {
@@ -20,9 +24,13 @@ class TextProcessor:
             'multiple_newlines': re.compile(r'\n\s*\n'),
             'special_chars': re.compile(r'[^\w\s\.\,\!\?\;\:\-\(\)\[\]\"\']'),
             'urls': re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'),
-            'emails': re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+            'emails': re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+            'sentence_endings': re.compile(r'[.!?]+\s+')
         }
         
+        # Tabella per rimuovere la punteggiatura in tokenizzazione
+        self.punctuation_table = str.maketrans('', '', string.punctuation)
+        
         # Stop words comuni in italiano
         self.stop_words = {
             'il', 'la', 'le', 'i', 'lo', 'gli', 'un', 'una', 'di', 'da', 'in', 'con', 
@@ -33,6 +41,13 @@ class TextProcessor:
             'questo', 'questa', 'questi', 'quelle', 'quel', 'quello', 'quelli', 'quelle',
             'che', 'chi', 'cui', 'quale', 'quali', 'quanto', 'quanta', 'quanti', 'quante'
         }
+        
+        # Cache LRU per istanza: durante l'estrazione delle features lo stesso
+        # documento viene tokenizzato e diviso in frasi da molte routine diverse.
+        # Solo documenti interi: le singole frasi passano cache=False, altrimenti
+        # sui testi lunghi sfratterebbero proprio la voce del documento
+        self._tokenize_cached = lru_cache(maxsize=self.CACHE_MAX_DOCUMENTS)(self._tokenize)
+        self._split_sentences_cached = lru_cache(maxsize=self.CACHE_MAX_DOCUMENTS)(self._split_sentences)
 
     def normalize_text(self, text: str) -> str:
         """Normalizza il testo rimuovendo caratteri speciali e normalizzando unicode"""
@@ -55,24 +70,37 @@ class TextProcessor:
         
         return text.strip()
 
-    def tokenize(self, text: str) -> List[str]:
-        """Tokenizza il testo in parole"""
+    def tokenize(self, text: str, cache: bool = True) -> List[str]:
+        """Tokenizza il testo in parole (cache=False per frasi e frammenti)"""
+        if not cache:
+            return list(self._tokenize(text))
+        return list(self._tokenize_cached(text))
+
+    def split_sentences(self, text: str) -> List[str]:
+        """Divide il testo in frasi"""
+        return list(self._split_sentences_cached(text))
+
+    def clear_cache(self):
+        """Svuota la cache di tokenizzazione e divisione in frasi"""
+        self._tokenize_cached.cache_clear()
+        self._split_sentences_cached.cache_clear()
+
+    def _tokenize(self, text: str) -> Tuple[str, ...]:
+        """Tokenizzazione effettiva (non cache)"""
         text = self.normalize_text(text.lower())
         
         # Rimuovi punteggiatura per tokenizzazione
-        translator = str.maketrans('', '', string.punctuation)
-        words = text.translate(translator).split()
+        words = text.translate(self.punctuation_table).split()
         
         # Filtra parole troppo corte e stop words
-        return [word for word in words if len(word) > 2 and word not in self.stop_words]
+        return tuple(word for word in words if len(word) > 2 and word not in self.stop_words)
 
-    def split_sentences(self, text: str) -> List[str]:
-        """Divide il testo in frasi"""
+    def _split_sentences(self, text: str) -> Tuple[str, ...]:
+        """Divisione in frasi effettiva (non cache)"""
         text = self.normalize_text(text)
         
         # Pattern per dividere in frasi (migliorato)
-        sentence_endings = r'[.!?]+\s+'
-        sentences = re.split(sentence_endings, text)
+        sentences = self.cleaning_patterns['sentence_endings'].split(text)
         
         # Pulisci le frasi
         cleaned_sentences = []
@@ -81,7 +109,7 @@ class TextProcessor:
             if len(sentence) > 5:  # Solo frasi con più di 5 caratteri
                 cleaned_sentences.append(sentence)
         
-        return cleaned_sentences
+        return tuple(cleaned_sentences)
 
     def extract_paragraphs(self, text: str) -> List[str]:
         """Estrae paragrafi dal testo"""
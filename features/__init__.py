@@ -0,0 +1 @@
+# Features Package for TextAnalyzer
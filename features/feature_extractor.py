@@ -11,12 +11,95 @@ from collections import Counter
 from typing import Dict, List, Any, Tuple
 from datetime import datetime
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from core.text_processor import TextProcessor
 
 
+def _readability_indices(total_words: int, total_sentences: int, total_syllables: int,
+                         complex_words: int, alnum_chars: int, letters: int,
+                         text_words: int) -> Tuple[float, float, float, float, float, float, float]:
+    """Calcola gli indici di leggibilità a partire dai conteggi del testo
+    
+    Riceve solo interi già calcolati (nessuna nuova scansione del testo).
+    Richiede total_words > 0 e total_sentences > 0.
+    
+    total_words conta i token di tokenize (senza stop words né parole brevi);
+    text_words conta tutte le parole del testo, la stessa base di letters e
+    total_sentences, ed è quella richiesta da Gulpease e dalla soglia di Fog.
+    
+    Gunning Fog e SMOG valgono 0.0 sotto le soglie di validità statistica
+    delle formule: almeno 100 parole del testo (text_words) per Fog e
+    almeno 30 frasi per SMOG.
+    
+    Returns:
+        Tuple (Flesch Reading Ease, Flesch-Kincaid Grade, Gunning Fog,
+        Automated Readability Index, Coleman-Liau, SMOG, Gulpease)
+    """
+    avg_sentence_length = total_words / total_sentences
+    avg_syllables_per_word = total_syllables / total_words
+    
+    # Flesch Reading Ease (range 0-100) e Flesch-Kincaid Grade Level
+    if avg_syllables_per_word > 0:
+        flesch = max(0, min(100, 206.835 - (1.015 * avg_sentence_length) - (84.6 * avg_syllables_per_word)))
+        kincaid = max(0, (0.39 * avg_sentence_length) + (11.8 * avg_syllables_per_word) - 15.59)
+    else:
+        flesch = kincaid = 0.0
+    
+    # Gunning Fog (campione minimo di 100 parole)
+    if text_words >= 100:
+        fog = max(0, 0.4 * (avg_sentence_length + (complex_words / total_words * 100)))
+    else:
+        fog = 0.0
+    
+    # Automated Readability Index
+    ari = max(0, (4.71 * alnum_chars / total_words) + (0.5 * avg_sentence_length) - 21.43)
+    
+    # Coleman-Liau
+    letters_per_100_words = (letters / total_words) * 100
+    sentences_per_100_words = (total_sentences / total_words) * 100
+    coleman_liau = max(0, (0.0588 * letters_per_100_words) - (0.296 * sentences_per_100_words) - 15.8)
+    
+    # SMOG (Simple Measure of Gobbledygook), definito su almeno 30 frasi
+    if total_sentences >= 30 and complex_words:
+        smog = max(0, 1.0430 * (complex_words * (30 / total_sentences)) + 3.1291)
+    else:
+        smog = 0.0
+    
+    # Gulpease: indice nativo per l'italiano (range 0-100), senza sillabe
+    gulpease = max(0, min(100, 89 + (300 * total_sentences - 10 * letters) / text_words))
+    
+    return flesch, kincaid, fog, ari, coleman_liau, smog, gulpease
+
+
 class FeatureExtractor:
     """Estrae features avanzate per la classificazione di testi AI vs umani"""
     
+    # Connettivi logici (già in minuscolo, confrontati con i token di tokenize)
+    CONNECTORS = frozenset({
+        'invece', 'tuttavia', 'pertanto', 'conseguentemente', 'quindi', 'dunque', 'dato che',
+        'poiché', 'perché', 'sebbene', 'benché', 'qualora', 'purché', 'mentre', 'durante',
+        'infatti', 'ovviamente', 'certamente', 'indubbiamente', 'presumibilmente',
+        'd\'altro canto', 'altresì', 'peraltro', 'sicuramente', 'probabilmente', 'possibilmente'
+    })
+    
+    # Indicatori di subordinazione
+    SUBORDINATE_INDICATORS = frozenset({
+        'che', 'qualora', 'benché', 'sebbene', 'purché', 'affinché', 'perché', 'dato che',
+        'poiché', 'mentre', 'quando', 'se', 'nonostante', 'malgrado'
+    })
+    
+    # Suffissi e radici tipici di termini tecnici
+    TECHNICAL_INDICATORS = (
+        'izzazione', 'ificazione', 'ologia', 'grafia', 'metria', 'scopia',
+        'sintesi', 'analisi', 'metodologia', 'filosofia', 'teoria', 'prassi', 'pratiche',
+        'processo', 'procedimento', 'sistema', 'apparato', 'meccanismo', 'funzionamento',
+        'struttura', 'organizzazione', 'architettura', 'configurazione', 'implementazione'
+    )
+    
     def __init__(self):
         self.text_processor = TextProcessor()
         
@@ -28,7 +111,12 @@ class FeatureExtractor:
             'foreign_words': re.compile(r'\b[a-zA-ZÀ-ÿ]+(?:\s+[a-zA-ZÀ-ÿ]+)*\b'),
             'complex_sentences': re.compile(r'\b(?:poiché|pertanto|quindi|tuttavia|conseguentemente|perciò)\b'),
             'questions': re.compile(r'\?+'),
-            'exclamations': re.compile(r'!+')
+            'exclamations': re.compile(r'!+'),
+            # Sequenze di alfanumerici (equivale a str.isalnum): il conteggio avviene in C
+            'alphanumerics': re.compile(r'[^\W_]+'),
+            # Un'unica alternanza compilata: una sola scansione per parola
+            'technical_terms': re.compile('|'.join(map(re.escape, self.TECHNICAL_INDICATORS))),
+            'vowel_groups': re.compile(r'[aeiouyàèéìíòóùú]+')
         }
         
         # Parole chiave per analisi semantica
@@ -87,7 +175,7 @@ class FeatureExtractor:
         
         # Pattern complessi
         complex_sentences = sum(1 for sentence in sentences 
-                              if len(re.findall(r'\b(?:poiché|pertanto|quindi|tuttavia|conseguentemente|perciò)\b', sentence)) > 0)
+                              if self.patterns['complex_sentences'].search(sentence))
         
         # Analisi lunghezza frasi
         sentence_lengths = [len(sentence.split()) for sentence in sentences]
@@ -377,9 +465,9 @@ class FeatureExtractor:
             'mediocrità', 'banalità', 'noia', 'monotonia', 'repetitività'
         }
         
-        # Conteggio sentiment
-        positive_count = sum(1 for word in words if word.lower() in positive_words)
-        negative_count = sum(1 for word in words if word.lower() in negative_words)
+        # Conteggio sentiment (i token sono già in minuscolo)
+        positive_count = sum(1 for word in words if word in positive_words)
+        negative_count = sum(1 for word in words if word in negative_words)
         total_sentiment_words = len(words)
         
         # Calcolo sentiment score
@@ -395,11 +483,11 @@ class FeatureExtractor:
         
         # Emozioni specifiche
         emotion_indicators = {
-            'joy_indicators': sum(1 for word in words if word.lower() in {'felice', 'contento', 'gioioso', 'allegro', 'lieto'}),
-            'sadness_indicators': sum(1 for word in words if word.lower() in {'triste', 'mesto', 'addolorato', 'piangere', 'lacrime'}),
-            'anger_indicators': sum(1 for word in words if word.lower() in {'arrabbiato', 'furioso', 'irritato', 'indignato', 'sdegno'}),
-            'fear_indicators': sum(1 for word in words if word.lower() in {'paura', 'terrore', 'panico', 'spavento', 'inquietudine'}),
-            'surprise_indicators': sum(1 for word in words if word.lower() in {'sorpresa', 'stupore', 'incredulo', 'meravigliato', 'sorpreso'})
+            'joy_indicators': sum(1 for word in words if word in {'felice', 'contento', 'gioioso', 'allegro', 'lieto'}),
+            'sadness_indicators': sum(1 for word in words if word in {'triste', 'mesto', 'addolorato', 'piangere', 'lacrime'}),
+            'anger_indicators': sum(1 for word in words if word in {'arrabbiato', 'furioso', 'irritato', 'indignato', 'sdegno'}),
+            'fear_indicators': sum(1 for word in words if word in {'paura', 'terrore', 'panico', 'spavento', 'inquietudine'}),
+            'surprise_indicators': sum(1 for word in words if word in {'sorpresa', 'stupore', 'incredulo', 'meravigliato', 'sorpreso'})
         }
         
         # Sentiment analysis features
@@ -429,14 +517,14 @@ class FeatureExtractor:
         
         sentence_sentiments = []
         for sentence in sentences:
-            words = self.text_processor.tokenize(sentence)
+            words = self.text_processor.tokenize(sentence, cache=False)
             if words:
                 # Calcola sentiment per ogni frase
                 positive_words = {'bene', 'buono', 'ottimo', 'felice', 'positivo', 'bellissimo', 'fantastico'}
                 negative_words = {'male', 'cattivo', 'terribile', 'triste', 'negativo', 'orribile', 'pessimo'}
                 
-                pos_count = sum(1 for word in words if word.lower() in positive_words)
-                neg_count = sum(1 for word in words if word.lower() in negative_words)
+                pos_count = sum(1 for word in words if word in positive_words)
+                neg_count = sum(1 for word in words if word in negative_words)
                 
                 sentiment_score = (pos_count - neg_count) / len(words) if words else 0
                 sentence_sentiments.append(sentiment_score)
@@ -475,14 +563,14 @@ class FeatureExtractor:
         
         sentence_sentiments = []
         for sentence in sentences:
-            words = self.text_processor.tokenize(sentence)
+            words = self.text_processor.tokenize(sentence, cache=False)
             if words:
                 # Mappatura semplificata del sentiment
                 positive_patterns = ['bene', 'buono', 'felice', 'ottimo', 'contento', 'positivo', 'bellissimo']
                 negative_patterns = ['male', 'cattivo', 'triste', 'terribile', 'negativo', 'pessimo', 'orribile']
                 
-                pos_score = sum(1 for word in words if word.lower() in positive_patterns)
-                neg_score = sum(1 for word in words if word.lower() in negative_patterns)
+                pos_score = sum(1 for word in words if word in positive_patterns)
+                neg_score = sum(1 for word in words if word in negative_patterns)
                 
                 if pos_score > neg_score:
                     sentence_sentiments.append(1.0)  # Positivo
@@ -527,32 +615,46 @@ class FeatureExtractor:
             return self._empty_readability_features()
         
         total_sentences = len(sentences)
-        total_words = len(words)
-        total_syllables = self._count_syllables_in_text(text)
+        # Un solo passaggio sui token per sillabe totali e parole 3+/4+ sillabe
+        total_words, complex_words, polysyllabic_words, total_syllables = self._syllable_stats(words)
         
         # Calcolo metriche base
         avg_sentence_length = total_words / total_sentences
         avg_syllables_per_word = total_syllables / total_words if total_words > 0 else 0
         
-        # Indici di leggibilità
+        # Indici di leggibilità (inglesi + Gulpease): tutti derivano dagli stessi conteggi
+        flesch, kincaid, fog, ari, coleman_liau, smog, gulpease = _readability_indices(
+            total_words, total_sentences, total_syllables, complex_words,
+            self._count_pattern_chars('alphanumerics', text),
+            # Non [^\W\d_]: includerebbe ², ½ e simili, che isalpha esclude
+            sum(map(str.isalpha, text)),
+            len(text.split())
+        )
         readability_scores = {
-            'flesch_reading_ease': self._calculate_flesch_reading_ease(avg_sentence_length, avg_syllables_per_word),
-            'flesch_kincaid_grade': self._calculate_flesch_kincaid_grade(avg_sentence_length, avg_syllables_per_word),
-            'gunning_fog_index': self._calculate_gunning_fog_index(text, avg_sentence_length),
-            'automated_readability_index': self._calculate_automated_readability_index(text, words),
-            'coleman_liau_index': self._calculate_coleman_liau_index(text),
-            'smog_index': self._calculate_smog_index(text, total_sentences)
+            'flesch_reading_ease': flesch,
+            'flesch_kincaid_grade': kincaid,
+            'gunning_fog_index': fog,
+            'automated_readability_index': ari,
+            'coleman_liau_index': coleman_liau,
+            'smog_index': smog,
+            'gulpease_index': gulpease
         }
         
+        # Lunghezze delle frasi calcolate una volta per le tre soglie
+        sentence_lengths = [len(sentence.split()) for sentence in sentences]
+        long_sentences = sum(1 for length in sentence_lengths if length > 20)
+        very_long_sentences = sum(1 for length in sentence_lengths if length > 30)
+        short_sentences = sum(1 for length in sentence_lengths if length < 8)
+        
         # Metriche di complessità linguistica
         complexity_features = {
             'avg_sentence_length': avg_sentence_length,
             'avg_syllables_per_word': avg_syllables_per_word,
-            'long_sentences_ratio': sum(1 for sentence in sentences if len(sentence.split()) > 20) / total_sentences,
-            'very_long_sentences_ratio': sum(1 for sentence in sentences if len(sentence.split()) > 30) / total_sentences,
-            'short_sentences_ratio': sum(1 for sentence in sentences if len(sentence.split()) < 8) / total_sentences,
-            'complex_words_ratio': self._calculate_complex_words_ratio(words, total_syllables),
-            'polysyllabic_words_ratio': self._calculate_polysyllabic_words_ratio(words),
+            'long_sentences_ratio': long_sentences / total_sentences,
+            'very_long_sentences_ratio': very_long_sentences / total_sentences,
+            'short_sentences_ratio': short_sentences / total_sentences,
+            'complex_words_ratio': complex_words / total_words,
+            'polysyllabic_words_ratio': polysyllabic_words / total_words,
             'technical_terms_ratio': self._calculate_technical_terms_ratio(words)
         }
         
@@ -561,7 +663,7 @@ class FeatureExtractor:
             'paragraph_count': len(self.text_processor.extract_paragraphs(text)),
             'avg_sentence_length_variance': self._calculate_sentence_length_variance(sentences),
             'connectors_ratio': self._calculate_connectors_ratio(words),
-            'subordination_ratio': self._calculate_subordination_ratio(text)
+            'subordination_ratio': self._calculate_subordination_ratio(sentences)
         }
         
         # Combina tutte le features
@@ -571,20 +673,31 @@ class FeatureExtractor:
     def _count_syllables_in_text(self, text: str) -> int:
         """Conta le sillabe totali nel testo"""
         words = self.text_processor.tokenize(text)
-        return sum(self._count_syllables(word) for word in words)
+        return self._syllable_stats(words)[3]
+    
+    def _syllable_stats(self, words: List[str]) -> Tuple[int, int, int, int]:
+        """Calcola in un solo passaggio le statistiche sillabiche dei token
+        
+        Returns:
+            Tuple (parole, parole con 3+ sillabe, parole con 4+ sillabe, sillabe totali)
+        """
+        complex_words = polysyllabic_words = total_syllables = 0
+        # Le sillabe si contano una volta per parola distinta
+        for word, count in Counter(words).items():
+            syllables = self._count_syllables(word)
+            total_syllables += syllables * count
+            if syllables >= 3:
+                complex_words += count
+                if syllables >= 4:
+                    polysyllabic_words += count
+        
+        return len(words), complex_words, polysyllabic_words, total_syllables
     
     def _count_syllables(self, word: str) -> int:
         """Conta le sillabe in una parola (approssimazione)"""
-        word = word.lower()
-        vowels = 'aeiouyàèéìíòóùú'
-        syllable_count = 0
-        previous_was_vowel = False
-        
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not previous_was_vowel:
-                syllable_count += 1
-            previous_was_vowel = is_vowel
+        # I token di tokenize sono già in minuscolo
+        # Ogni gruppo di vocali consecutive conta come una sillaba
+        syllable_count = len(self.patterns['vowel_groups'].findall(word))
         
         # Aggiusta per parole che finiscono con silenti
         if word.endswith('e') and syllable_count > 1:
@@ -592,166 +705,80 @@ class FeatureExtractor:
         
         return max(1, syllable_count)  # Almeno una sillaba per parola
     
-    def _calculate_flesch_reading_ease(self, avg_sentence_length: float, avg_syllables_per_word: float) -> float:
-        """Calcola l'indice di leggibilità Flesch Reading Ease"""
-        if avg_sentence_length <= 0 or avg_syllables_per_word <= 0:
-            return 0.0
-        
-        score = 206.835 - (1.015 * avg_sentence_length) - (84.6 * avg_syllables_per_word)
-        return max(0, min(100, score))  # Range 0-100
-    
-    def _calculate_flesch_kincaid_grade(self, avg_sentence_length: float, avg_syllables_per_word: float) -> float:
-        """Calcola l'indice Flesch-Kincaid Grade Level"""
-        if avg_sentence_length <= 0 or avg_syllables_per_word <= 0:
-            return 0.0
-        
-        score = (0.39 * avg_sentence_length) + (11.8 * avg_syllables_per_word) - 15.59
-        return max(0, score)
-    
-    def _calculate_gunning_fog_index(self, text: str, avg_sentence_length: float) -> float:
-        """Calcola l'indice Gunning Fog"""
-        words = self.text_processor.tokenize(text)
-        if not words or avg_sentence_length <= 0:
-            return 0.0
-        
-        complex_words = sum(1 for word in words if self._count_syllables(word) >= 3)
-        complex_words_ratio = complex_words / len(words)
-        
-        score = 0.4 * (avg_sentence_length + (complex_words_ratio * 100))
-        return max(0, score)
-    
-    def _calculate_automated_readability_index(self, text: str, words: List[str]) -> float:
-        """Calcola l'Automated Readability Index"""
-        if not words or len(text) == 0:
-            return 0.0
-        
-        characters = sum(1 for char in text if char.isalnum())
-        avg_characters_per_word = characters / len(words)
-        
-        sentences = self.text_processor.split_sentences(text)
-        if not sentences:
-            return 0.0
-        
-        score = (4.71 * avg_characters_per_word) + (0.5 * len(words) / len(sentences)) - 21.43
-        return max(0, score)
-    
-    def _calculate_coleman_liau_index(self, text: str) -> float:
-        """Calcola l'indice Coleman-Liau"""
-        if not text:
-            return 0.0
-        
-        letters = sum(1 for char in text if char.isalpha())
-        words = self.text_processor.tokenize(text)
-        sentences = self.text_processor.split_sentences(text)
-        
-        if not words or not sentences:
-            return 0.0
-        
-        letters_per_100_words = (letters / len(words)) * 100
-        sentences_per_100_words = (len(sentences) / len(words)) * 100
-        
-        score = (0.0588 * letters_per_100_words) - (0.296 * sentences_per_100_words) - 15.8
-        return max(0, score)
-    
-    def _calculate_smog_index(self, text: str, total_sentences: int) -> float:
-        """Calcola l'indice SMOG (Simple Measure of Gobbledygook)"""
-        if total_sentences < 1:
-            return 0.0
-        
-        words = self.text_processor.tokenize(text)
-        polysyllabic_words = sum(1 for word in words if self._count_syllables(word) >= 3)
-        
-        if polysyllabic_words == 0:
-            return 0.0
-        
-        score = 1.0430 * (polysyllabic_words * (30 / total_sentences)) + 3.1291
-        return max(0, score)
-    
-    def _calculate_complex_words_ratio(self, words: List[str], total_syllables: int) -> float:
-        """Calcola il rapporto di parole complesse (3+ sillabe)"""
-        if not words:
-            return 0.0
-        
-        complex_words = sum(1 for word in words if self._count_syllables(word) >= 3)
-        return complex_words / len(words)
-    
-    def _calculate_polysyllabic_words_ratio(self, words: List[str]) -> float:
-        """Calcola il rapporto di parole polisillabiche (4+ sillabe)"""
-        if not words:
-            return 0.0
-        
-        polysyllabic_words = sum(1 for word in words if self._count_syllables(word) >= 4)
-        return polysyllabic_words / len(words)
+    def _count_pattern_chars(self, pattern_name: str, text: str) -> int:
+        """Conta i caratteri coperti dalle sequenze di un pattern"""
+        return sum(len(run) for run in self.patterns[pattern_name].findall(text))
     
     def _calculate_technical_terms_ratio(self, words: List[str]) -> float:
         """Calcola il rapporto di termini tecnici (parole lunghe e complesse)"""
         if not words:
             return 0.0
         
-        technical_indicators = [
-            # Suffissi tipici di termini tecnici
-            'izzazione', 'ificazione', 'izzazione', 'ologia', 'grafia', 'metria', 'scopia',
-            'sintesi', 'analisi', 'metodologia', 'filosofia', 'teoria', 'prassi', 'pratiche',
-            'processo', 'procedimento', 'sistema', 'apparato', 'meccanismo', 'funzionamento',
-            'struttura', 'organizzazione', 'architettura', 'configurazione', 'implementazione'
-        ]
-        
+        technical_pattern = self.patterns['technical_terms']
         technical_terms = sum(1 for word in words 
-                            if len(word) > 8 and 
-                            any(suffix in word.lower() for suffix in technical_indicators))
+                            if len(word) > 8 and technical_pattern.search(word))
         
         return technical_terms / len(words)
     
     def _calculate_sentence_length_variance(self, sentences: List[str]) -> float:
-        """Calcola la varianza della lunghezza delle frasi"""
+        """Calcola la varianza della lunghezza delle frasi
+        
+        Varianza di popolazione (divisione per n, ddof=0): è la convenzione
+        con cui la feature è sempre stata calcolata, e va mantenuta per non
+        spostare i punteggi dei modelli già addestrati.
+        """
         if len(sentences) < 2:
             return 0.0
         
-        sentence_lengths = [len(sentence.split()) for sentence in sentences]
-        mean_length = sum(sentence_lengths) / len(sentence_lengths)
-        variance = sum((length - mean_length) ** 2 for length in sentence_lengths) / len(sentence_lengths)
-        return variance
+        # Le frasi arrivano già normalizzate (spazi singoli), quindi il numero
+        # di parole è il numero di spazi + 1: evita le liste create da split()
+        if np is not None:
+            sentence_lengths = np.fromiter((sentence.count(' ') + 1 for sentence in sentences),
+                                           dtype=np.int32, count=len(sentences))
+            return float(sentence_lengths.var(ddof=0))
+        
+        # Fallback senza numpy: media e varianza in un solo passaggio (Welford)
+        mean_length = 0.0
+        squared_deviations = 0.0
+        for n, sentence in enumerate(sentences, 1):
+            length = sentence.count(' ') + 1
+            delta = length - mean_length
+            mean_length += delta / n
+            squared_deviations += delta * (length - mean_length)
+        return squared_deviations / len(sentences)
     
     def _calculate_connectors_ratio(self, words: List[str]) -> float:
         """Calcola il rapporto di connettivi logici"""
-        connectors = {
-            'invece', 'tuttavia', 'pertanto', 'conseguentemente', 'quindi', 'dunque', 'dato che',
-            'poiché', 'perché', 'sebbene', 'benché', 'qualora', 'purché', 'mentre', 'durante',
-            'pertanto', 'infatti', 'ovviamente', 'certamente', 'indubbiamente', 'presumibilmente',
-            'd\'altro canto', 'altresì', 'peraltro', 'sicuramente', 'probabilmente', 'possibilmente'
-        }
-        
         if not words:
             return 0.0
         
-        connector_count = sum(1 for word in words if word.lower() in connectors)
+        connector_count = sum(1 for word in words if word in self.CONNECTORS)
         return connector_count / len(words)
     
-    def _calculate_subordination_ratio(self, text: str) -> float:
-        """Calcola il rapporto di subordinazione (frasi complesse)"""
-        sentences = self.text_processor.split_sentences(text)
+    def _calculate_subordination_ratio(self, sentences: List[str]) -> float:
+        """Calcola il rapporto di subordinazione (frasi complesse)
+        
+        Confronta i token di ogni frase (minuscoli, senza accenti) con
+        SUBORDINATE_INDICATORS così com'è: le forme accentate e 'dato che'
+        non vengono mai trovate. È il comportamento con cui la feature è stata
+        calcolata finora e va mantenuto per non spostare i punteggi dei
+        modelli già addestrati.
+        """
         if not sentences:
             return 0.0
         
-        subordinate_indicators = [
-            'che', 'qualora', 'benché', 'sebbene', 'purché', 'affinché', 'perché', 'dato che',
-            'poiché', 'mentre', 'quando', 'se', 'qualora', 'qualora', 'nonostante', 'malgrado'
-        ]
-        
-        complex_sentences = 0
-        for sentence in sentences:
-            sentence_words = self.text_processor.tokenize(sentence)
-            subordinate_count = sum(1 for word in sentence_words if word.lower() in subordinate_indicators)
-            if subordinate_count > 0:
-                complex_sentences += 1
-        
+        tokenize = self.text_processor.tokenize
+        complex_sentences = sum(
+            1 for sentence in sentences
+            if not self.SUBORDINATE_INDICATORS.isdisjoint(tokenize(sentence, cache=False))
+        )
         return complex_sentences / len(sentences)
     
     def _empty_readability_features(self) -> Dict[str, float]:
         return {key: 0.0 for key in [
             'flesch_reading_ease', 'flesch_kincaid_grade', 'gunning_fog_index',
             'automated_readability_index', 'coleman_liau_index', 'smog_index',
-            'avg_sentence_length', 'avg_syllables_per_word', 'long_sentences_ratio',
+            'gulpease_index', 'avg_sentence_length', 'avg_syllables_per_word', 'long_sentences_ratio',
             'very_long_sentences_ratio', 'short_sentences_ratio', 'complex_words_ratio',
             'polysyllabic_words_ratio', 'technical_terms_ratio', 'paragraph_count',
             'avg_sentence_length_variance', 'connectors_ratio', 'subordination_ratio'
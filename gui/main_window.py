@@ -6,34 +6,270 @@ Interfaccia grafica moderna PySide6 per TextAnalyzer
 """
 
 import sys
-sys.path.insert(0, '/home/martina/PycharmProjects/TextAnalyzer')
+import threading
 
 from PySide6.QtWidgets import (QMainWindow, QApplication, QVBoxLayout, QHBoxLayout,
-                               QWidget, QTextEdit, QPushButton, QLabel, QFileDialog,
+                               QWidget, QPlainTextEdit, QPushButton, QLabel, QFileDialog,
                                QMessageBox, QGroupBox, QScrollArea, QProgressBar,
-                               QStatusBar, QFrame, QGridLayout)
-from PySide6.QtCore import Qt, QTimer
+                               QStatusBar, QFrame, QFormLayout)
+from PySide6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QFont, QIcon, QPixmap
 
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Tuple, TYPE_CHECKING
 
-from core.text_analyzer import TextAnalyzer, AnalysisResult
+from utils.data_loader import DataLoader
+
+if TYPE_CHECKING:
+    from core.text_analyzer import TextAnalyzer, AnalysisResult
+
+
+_shared_analyzer = None
+_shared_analyzer_lock = threading.Lock()
+# TextAnalyzer non è thread-safe (cache LRU e statistiche senza lock): il flag
+# _analysis_inflight è per finestra, quindi le analisi vengono serializzate qui
+_shared_analysis_lock = threading.Lock()
+
+
+def get_shared_analyzer() -> "TextAnalyzer":
+    """Restituisce il TextAnalyzer condiviso dalle finestre, creato al primo uso.
+
+    L'import del motore (ensemble, numpy, ...) avviene solo qui, così
+    l'apertura della finestra non paga il costo di inizializzazione.
+    Il lock evita una doppia creazione tra warm-up in background e UI.
+    """
+    global _shared_analyzer
+    if _shared_analyzer is None:
+        with _shared_analyzer_lock:
+            if _shared_analyzer is None:
+                from core.text_analyzer import TextAnalyzer
+                _shared_analyzer = TextAnalyzer(auto_calibrate=False, debug=False,
+                                                persistent_cache=True)
+    return _shared_analyzer
+
+
+def _warm_up_shared_analyzer():
+    """Crea il TextAnalyzer condiviso in background (errori rimandati al primo uso)"""
+    try:
+        get_shared_analyzer()
+    except Exception:
+        pass
+
+
+class _TaskSignals(QObject):
+    """Signal emessi dai task in background verso il thread UI"""
+    finished = Signal(object)
+    error = Signal(str)
+
+
+class _AnalyzeTask(QRunnable):
+    """Esegue l'analisi di un testo nel QThreadPool, fuori dal thread UI"""
+
+    def __init__(self, text: str):
+        super().__init__()
+        self.text = text
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            analyzer = get_shared_analyzer()
+            with _shared_analysis_lock:
+                result = analyzer.analyze(self.text)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
+class _LoadFileTask(QRunnable):
+    """Legge un file di testo nel QThreadPool (buffer ampio, encoding di fallback)"""
+
+    def __init__(self, filepath: str):
+        super().__init__()
+        self.filepath = filepath
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            content = DataLoader().load_text_file(self.filepath)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit((self.filepath, content))
 
 
 class TextAnalyzerGUI(QMainWindow):
     """Interfaccia grafica principale per TextAnalyzer"""
 
+    TEXT_DEBOUNCE_MS = 150
+    EXPORT_FILTER_JSON = "JSON Files (*.json)"
+    EXPORT_FILTER_GZIP = "Compressed JSON (*.json.gz)"
+    STATUS_FLUSH_MS = 16
+
+    HELP_TEXT = """🧠 TextAnalyzer - Ensemble AI Detection
+
+COMANDI:
+• 🔍 Analisi Standard: Analisi base con ensemble
+• 🧠 Analisi Avanzata: Analisi completa con confidence metrics
+
+ANalyzers UTILIZZATI:
+1. LexicalAnalyzer - Metriche lessicali (TTR, Burstiness)
+2. SyntacticAnalyzer - Variabilità frasi, pattern
+3. SemanticAnalyzer - Coerenza, densità concettuale
+4. StylisticAnalyzer - Punteggiatura, maiuscole
+5. MLAnalyzer - Entropia, transizioni, ML proxy
+
+CLASSIFICAZIONE:
+• AI Probability > 0.6: Probabilmente AI
+• AI Probability < 0.4: Probabilmente Umano
+• 0.4-0.6: Indeterminato
+
+Per calibrazione automatica, usa il comando:
+python3 cli.py --text "testo" --calibrate
+
+Per ulteriori info, vedi CLAUDE.md"""
+
+    # Messaggi di stato ricorrenti
+    STATUS_READY = "Ready - Inserisci un testo per iniziare"
+    STATUS_WELCOME = "Welcome! Inserisci un testo e clicca '🧠 Analisi Avanzata' per iniziare"
+    STATUS_BUSY = "Analisi in corso..."
+    STATUS_ERROR = "Errore nell'analisi"
+    STATUS_CLEARED = "Testo pulito"
+
+    # Foglio di stile della finestra, costruito una volta sola a livello di classe.
+    # Le label sono stilizzate per objectName: niente fogli inline per widget
+    MAIN_STYLESHEET = """
+        QMainWindow {
+            background-color: #f5f5f5;
+        }
+        QGroupBox {
+            font-weight: bold;
+            font-size: 14px;
+            border: 2px solid #ccc;
+            border-radius: 8px;
+            margin: 5px;
+            padding-top: 15px;
+        }
+        QGroupBox::title {
+            subcontrol-origin: margin;
+            left: 10px;
+            padding: 0 8px 0 8px;
+        }
+        QGroupBox[accent="blue"] {
+            color: #2e86c1;
+            border-color: #2e86c1;
+        }
+        QGroupBox[accent="green"] {
+            color: #28a745;
+            border-color: #28a745;
+        }
+        QGroupBox[accent="purple"] {
+            color: #6f42c1;
+            border-color: #6f42c1;
+        }
+        QGroupBox[accent="grey"] {
+            color: #607d8b;
+            border-color: #607d8b;
+        }
+        QPlainTextEdit {
+            border: 1px solid #ddd;
+            border-radius: 4px;
+            padding: 8px;
+            background-color: white;
+            font-size: 13px;
+            font-family: 'Segoe UI', Arial, sans-serif;
+        }
+        QPushButton {
+            background-color: #007bff;
+            color: white;
+            border: none;
+            padding: 10px 20px;
+            border-radius: 6px;
+            font-weight: bold;
+            font-size: 12px;
+        }
+        QPushButton:hover {
+            background-color: #0056b3;
+        }
+        QPushButton:disabled {
+            background-color: #ccc;
+            color: #666;
+        }
+        QPushButton#advanced {
+            background-color: #6f42c1;
+        }
+        QPushButton#advanced:hover {
+            background-color: #5a32a3;
+        }
+        QLabel[class="probKey"] {
+            font-weight: bold;
+        }
+        QLabel[class="probValue"] {
+            font-size: 14px;
+            color: #2e86c1;
+        }
+        QLabel#title {
+            color: #2e86c1;
+        }
+        QLabel#stats {
+            color: #666;
+            font-size: 12px;
+        }
+        QLabel#footerInfo {
+            color: #666;
+            font-size: 11px;
+        }
+        QLabel#resultsPlaceholder {
+            color: #999;
+            font-size: 16px;
+            padding: 40px;
+            background-color: white;
+            border: 2px dashed #ddd;
+            border-radius: 8px;
+        }
+        QLabel#classification {
+            color: #2e86c1;
+            padding: 10px;
+        }
+        QLabel#certainty {
+            color: #28a745;
+        }
+        QLabel#confScore {
+            font-size: 13px;
+        }
+        QLabel#recommendation {
+            font-size: 12px;
+            color: #666;
+            padding: 8px;
+            background-color: #f8f9fa;
+            border-radius: 4px;
+        }
+        QLabel#analyzerRow {
+            font-size: 12px;
+            padding: 2px;
+        }
+        QLabel#processingTime {
+            font-size: 12px;
+        }
+        QLabel#timestamp {
+            font-size: 11px;
+            color: #666;
+        }
+    """
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("TextAnalyzer v3.0 - Ensemble AI Detection")
         self.setMinimumSize(1200, 800)
         self.resize(1400, 900)
 
-        # Core components
-        self.analyzer = TextAnalyzer(auto_calibrate=False, debug=False)
+        # Core components (l'analyzer è creato al primo utilizzo)
         self.current_file = None
-        self.analysis_result: AnalysisResult = None
+        self.analysis_result: "AnalysisResult" = None
+        self._analysis_inflight = False
+        self._analysis_task: _AnalyzeTask = None
+        self._load_task: _LoadFileTask = None
+        self._help_box: QMessageBox = None
 
         # Setup UI
         self._setup_ui()
@@ -43,6 +279,18 @@ class TextAnalyzerGUI(QMainWindow):
         # Show welcome message
         QTimer.singleShot(1000, self._show_welcome_message)
 
+        # Warm-up del motore dopo il primo paint, sovrapposto all'input dell'utente
+        QTimer.singleShot(0, self._start_analyzer_warm_up)
+
+    @property
+    def analyzer(self) -> "TextAnalyzer":
+        """TextAnalyzer condiviso (lazy)"""
+        return get_shared_analyzer()
+
+    def _start_analyzer_warm_up(self):
+        """Avvia la creazione del TextAnalyzer in un thread daemon"""
+        threading.Thread(target=_warm_up_shared_analyzer, daemon=True).start()
+
     def _setup_ui(self):
         """Configura l'interfaccia utente"""
         # Central widget
@@ -77,14 +325,14 @@ class TextAnalyzerGUI(QMainWindow):
         # Title
         title = QLabel("🧠 TextAnalyzer - Ensemble AI Detection")
         title.setFont(QFont("Arial", 18, QFont.Bold))
-        title.setStyleSheet("color: #2e86c1;")
+        title.setObjectName("title")
         layout.addWidget(title)
 
         layout.addStretch()
 
         # Stats
         self.stats_label = QLabel("Ready")
-        self.stats_label.setStyleSheet("color: #666; font-size: 12px;")
+        self.stats_label.setObjectName("stats")
         layout.addWidget(self.stats_label)
 
         return layout
@@ -92,11 +340,12 @@ class TextAnalyzerGUI(QMainWindow):
     def _create_input_section(self):
         """Crea sezione input testo"""
         group = QGroupBox("📝 Input Testo")
-        group.setStyleSheet(self._get_group_style("#2e86c1"))
+        group.setProperty("accent", "blue")
         layout = QVBoxLayout(group)
 
         # Text input
-        self.text_input = QTextEdit()
+        # Editor solo testo: layout a blocchi lineare, adatto a file grandi
+        self.text_input = QPlainTextEdit()
         self.text_input.setPlaceholderText(
             "Inserisci qui il testo da analizzare...\n\n"
             "Oppure carica un file usando il pulsante '📂 Carica File'"
@@ -131,6 +380,10 @@ class TextAnalyzerGUI(QMainWindow):
         layout.addLayout(button_layout)
 
         # Connect text change
+        self._text_debounce = QTimer(self)
+        self._text_debounce.setSingleShot(True)
+        self._text_debounce.setInterval(self.TEXT_DEBOUNCE_MS)
+        self._text_debounce.timeout.connect(self._update_analyze_buttons)
         self.text_input.textChanged.connect(self._on_text_changed)
 
         return group
@@ -138,7 +391,7 @@ class TextAnalyzerGUI(QMainWindow):
     def _create_results_section(self):
         """Crea sezione risultati"""
         group = QGroupBox("📊 Risultati Analisi")
-        group.setStyleSheet(self._get_group_style("#28a745"))
+        group.setProperty("accent", "green")
         layout = QVBoxLayout(group)
 
         # Scroll area for results
@@ -146,10 +399,26 @@ class TextAnalyzerGUI(QMainWindow):
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
-        # Results widget
+        # Results widget: placeholder e card sono creati una volta sola,
+        # ogni analisi aggiorna solo il testo delle label
         self.results_widget = QWidget()
         self.results_layout = QVBoxLayout(self.results_widget)
 
+        self.results_placeholder = QLabel("📊 I risultati dell'analisi appariranno qui")
+        self.results_placeholder.setAlignment(Qt.AlignCenter)
+        self.results_placeholder.setObjectName("resultsPlaceholder")
+        self.results_layout.addWidget(self.results_placeholder)
+
+        self.results_cards = QWidget()
+        cards_layout = QVBoxLayout(self.results_cards)
+        cards_layout.setContentsMargins(0, 0, 0, 0)
+        cards_layout.addWidget(self._create_classification_card())
+        cards_layout.addWidget(self._create_confidence_card())
+        cards_layout.addWidget(self._create_analyzers_card())
+        cards_layout.addWidget(self._create_system_card())
+        self.results_layout.addWidget(self.results_cards)
+        self.results_layout.addStretch()
+
         # Placeholder
         self._show_results_placeholder()
 
@@ -174,7 +443,7 @@ class TextAnalyzerGUI(QMainWindow):
 
         # Info
         info_label = QLabel("Ensemble Text Analyzer v3.0 | 5 Analyzers | Calibrated System")
-        info_label.setStyleSheet("color: #666; font-size: 11px;")
+        info_label.setObjectName("footerInfo")
         layout.addWidget(info_label)
 
         layout.addStretch()
@@ -190,109 +459,54 @@ class TextAnalyzerGUI(QMainWindow):
         """Configura status bar"""
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
-        self.status_bar.showMessage("Ready - Inserisci un testo per iniziare")
+        self.status_bar.showMessage(self.STATUS_READY)
+
+        # Aggiornamenti di stato raggruppati: al massimo un repaint per frame
+        self._pending_status: str = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(self.STATUS_FLUSH_MS)
+        self._status_timer.timeout.connect(self._flush_status)
 
         # Progress bar (initially hidden)
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
         self.status_bar.addPermanentWidget(self.progress_bar)
 
+    def _queue_status(self, message: str):
+        """Accoda un messaggio di stato; vince l'ultimo entro lo stesso frame"""
+        self._pending_status = message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status(self):
+        """Mostra l'ultimo messaggio di stato accodato"""
+        if self._pending_status is not None:
+            self.status_bar.showMessage(self._pending_status)
+            self._pending_status = None
+
     def _setup_styles(self):
         """Configura stili CSS"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QGroupBox {
-                font-weight: bold;
-                font-size: 14px;
-                border: 2px solid #ccc;
-                border-radius: 8px;
-                margin: 5px;
-                padding-top: 15px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px 0 8px;
-            }
-            QTextEdit {
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                padding: 8px;
-                background-color: white;
-                font-size: 13px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            QPushButton {
-                background-color: #007bff;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-            QPushButton:disabled {
-                background-color: #ccc;
-                color: #666;
-            }
-            QPushButton#advanced {
-                background-color: #6f42c1;
-            }
-            QPushButton#advanced:hover {
-                background-color: #5a32a3;
-            }
-        """)
-
-    def _get_group_style(self, color: str) -> str:
-        """Genera stile per group box"""
-        return f"""
-            QGroupBox {{
-                font-weight: bold;
-                font-size: 14px;
-                color: {color};
-                border: 2px solid {color};
-                border-radius: 8px;
-                margin: 5px;
-                padding-top: 15px;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px 0 8px;
-            }}
-        """
+        self.setStyleSheet(self.MAIN_STYLESHEET)
 
     def _show_results_placeholder(self):
         """Mostra placeholder nei risultati"""
-        # Clear previous results
-        for i in reversed(range(self.results_layout.count())):
-            child = self.results_layout.itemAt(i).widget()
-            if child:
-                child.deleteLater()
-
-        placeholder = QLabel("📊 I risultati dell'analisi appariranno qui")
-        placeholder.setAlignment(Qt.AlignCenter)
-        placeholder.setStyleSheet("""
-            color: #999;
-            font-size: 16px;
-            padding: 40px;
-            background-color: white;
-            border: 2px dashed #ddd;
-            border-radius: 8px;
-        """)
-        self.results_layout.addWidget(placeholder)
-        self.results_layout.addStretch()
+        self.results_cards.setVisible(False)
+        self.results_placeholder.setVisible(True)
 
     def _on_text_changed(self):
-        """Gestisce cambio testo"""
-        has_text = len(self.text_input.toPlainText().strip()) > 0
-        self.analyze_btn.setEnabled(has_text)
-        self.advanced_btn.setEnabled(has_text)
+        """Gestisce cambio testo (debounce: raffiche di tasti -> un solo aggiornamento)"""
+        self._text_debounce.start()
+
+    def _update_analyze_buttons(self):
+        """Abilita i pulsanti di analisi se c'è testo e nessuna analisi in corso"""
+        # characterCount() è O(1) e include il paragrafo finale: nessuna copia
+        # del documento come con toPlainText(); il testo di soli spazi viene
+        # comunque respinto da _analyze_text
+        has_text = self.text_input.document().characterCount() > 1
+        can_analyze = has_text and not self._analysis_inflight
+        self.analyze_btn.setEnabled(can_analyze)
+        self.advanced_btn.setEnabled(can_analyze)
 
     def _load_file(self):
         """Carica file di testo"""
@@ -304,14 +518,29 @@ class TextAnalyzerGUI(QMainWindow):
         )
 
         if filepath:
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                self.text_input.setPlainText(content)
-                self.current_file = filepath
-                self.status_bar.showMessage(f"File caricato: {filepath}")
-            except Exception as e:
-                QMessageBox.critical(self, "Errore", f"Impossibile caricare il file:\n{str(e)}")
+            # Lettura in background: su dischi lenti/di rete la UI resta reattiva
+            self.load_btn.setEnabled(False)
+            self._queue_status(f"Caricamento file: {filepath}...")
+            task = _LoadFileTask(filepath)
+            task.signals.finished.connect(self._on_file_loaded)
+            task.signals.error.connect(self._on_file_load_error)
+            self._load_task = task
+            QThreadPool.globalInstance().start(task)
+
+    def _on_file_loaded(self, loaded: Tuple[str, str]):
+        """Mostra il contenuto del file letto in background"""
+        filepath, content = loaded
+        self._load_task = None
+        self.load_btn.setEnabled(True)
+        self.text_input.setPlainText(content)
+        self.current_file = filepath
+        self._queue_status(f"File caricato: {filepath}")
+
+    def _on_file_load_error(self, message: str):
+        """Gestisce un errore di caricamento file"""
+        self._load_task = None
+        self.load_btn.setEnabled(True)
+        QMessageBox.critical(self, "Errore", f"Impossibile caricare il file:\n{message}")
 
     def _clear_text(self):
         """Pulisce il testo"""
@@ -320,211 +549,235 @@ class TextAnalyzerGUI(QMainWindow):
         self.analysis_result = None
         self._show_results_placeholder()
         self.export_btn.setEnabled(False)
-        self.status_bar.showMessage("Testo pulito")
+        self._queue_status(self.STATUS_CLEARED)
 
     def _analyze_text(self):
         """Esegue analisi standard"""
-        text = self.text_input.toPlainText().strip()
+        # L'analisi gira in background: un secondo click mentre è in corso
+        # viene ignorato (una sola analisi alla volta)
+        if self._analysis_inflight:
+            return
+
+        # Documento vuoto: verifica O(1), senza copiare il testo
+        text = "" if self.text_input.document().isEmpty() else self.text_input.toPlainText().strip()
         if not text:
             QMessageBox.warning(self, "Attenzione", "Inserisci un testo da analizzare")
             return
 
+        self._analysis_inflight = True
+        self.analyze_btn.setEnabled(False)
+        self.advanced_btn.setEnabled(False)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)  # Indeterminate
+        self._queue_status(self.STATUS_BUSY)
+
+        # Analyze nel thread pool, il risultato torna via signal sul thread UI
+        task = _AnalyzeTask(text)
+        task.signals.finished.connect(self._on_analysis_finished)
+        task.signals.error.connect(self._on_analysis_error)
+        self._analysis_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_analysis_finished(self, result: "AnalysisResult"):
+        """Mostra il risultato dell'analisi completata in background"""
         try:
-            self.progress_bar.setVisible(True)
-            self.progress_bar.setRange(0, 0)  # Indeterminate
-            self.status_bar.showMessage("Analisi in corso...")
-            QApplication.processEvents()
-
-            # Analyze
-            result = self.analyzer.analyze(text)
             self.analysis_result = result
-
-            # Display
             self._display_results(result)
+            self._queue_status(f"Analisi completata in {result.processing_time_ms:.0f}ms")
+        except Exception as e:
+            self._on_analysis_error(str(e))
+            return
+        self._finish_analysis()
 
-            self.status_bar.showMessage(f"Analisi completata in {result.processing_time_ms:.0f}ms")
+    def _on_analysis_error(self, message: str):
+        """Gestisce un errore dell'analisi"""
+        QMessageBox.critical(self, "Errore", f"Errore durante l'analisi:\n{message}")
+        self._queue_status(self.STATUS_ERROR)
+        self._finish_analysis()
 
-        except Exception as e:
-            QMessageBox.critical(self, "Errore", f"Errore durante l'analisi:\n{str(e)}")
-            self.status_bar.showMessage("Errore nell'analisi")
-        finally:
-            self.progress_bar.setVisible(False)
+    def _finish_analysis(self):
+        """Ripristina lo stato della UI a fine analisi"""
+        self.progress_bar.setVisible(False)
+        self._analysis_task = None
+        self._analysis_inflight = False
+        self._update_analyze_buttons()
 
     def _analyze_advanced(self):
         """Esegue analisi avanzata (stessa di standard per ora)"""
         self._analyze_text()
 
-    def _display_results(self, result: AnalysisResult):
+    def _display_results(self, result: "AnalysisResult"):
         """Visualizza risultati dell'analisi"""
-        # Clear previous results
-        for i in reversed(range(self.results_layout.count())):
-            child = self.results_layout.itemAt(i).widget()
-            if child:
-                child.deleteLater()
+        # Una sola passata di paint per tutti gli aggiornamenti delle card
+        self.results_cards.setUpdatesEnabled(False)
+        try:
+            self._fill_result_cards(result)
+        finally:
+            self.results_cards.setUpdatesEnabled(True)
+
+        self.results_placeholder.setVisible(False)
+        self.results_cards.setVisible(True)
+
+        # Enable export
+        self.export_btn.setEnabled(True)
 
+    def _fill_result_cards(self, result: "AnalysisResult"):
+        """Scrive i valori del risultato nelle card già costruite"""
         # Classification card
-        self._create_classification_card(result)
+        self.class_label.setText(f"🎯 {result.classification}")
+        self.ai_prob_label.setText(f"{result.ai_probability:.4f}")
+        self.human_prob_label.setText(f"{result.human_probability:.4f}")
 
         # Confidence card
-        self._create_confidence_card(result)
+        self.certainty_label.setText(f"✨ Certainty: {result.certainty_level}")
+        self.confidence_label.setText(f"📊 Confidence Score: {result.confidence:.4f}")
+        self.recommendation_label.setText(f"💡 {result.recommendation}")
 
         # Individual analyzers card
-        self._create_analyzers_card(result)
+        self._update_analyzers_card(result)
 
         # System info card
-        self._create_system_card(result)
-
-        self.results_layout.addStretch()
+        self.time_label.setText(f"⏱️ Processing Time: {result.processing_time_ms:.2f}ms")
+        self.timestamp_label.setText(f"🕐 Timestamp: {result.timestamp[:19]}")
 
-        # Enable export
-        self.export_btn.setEnabled(True)
-
-    def _create_classification_card(self, result: AnalysisResult):
+    def _create_classification_card(self) -> QGroupBox:
         """Crea card classificazione"""
         card = QGroupBox("🧠 CLASSIFICAZIONE ENSEMBLE")
-        card.setStyleSheet(self._get_group_style("#2e86c1"))
+        card.setProperty("accent", "blue")
 
         layout = QVBoxLayout(card)
 
         # Classification
-        class_label = QLabel(f"🎯 {result.classification}")
-        class_label.setFont(QFont("Arial", 16, QFont.Bold))
-        class_label.setAlignment(Qt.AlignCenter)
-        class_label.setStyleSheet("color: #2e86c1; padding: 10px;")
-        layout.addWidget(class_label)
-
-        # Probabilities
-        prob_layout = QGridLayout()
-        prob_layout.addWidget(QLabel("🤖 AI Probability:"), 0, 0)
-        prob_layout.addWidget(QLabel(f"{result.ai_probability:.4f}"), 0, 1)
-        prob_layout.addWidget(QLabel("👤 Human Probability:"), 1, 0)
-        prob_layout.addWidget(QLabel(f"{result.human_probability:.4f}"), 1, 1)
-
-        for i in range(2):
-            prob_layout.itemAt(i*2).widget().setStyleSheet("font-weight: bold;")
-            prob_layout.itemAt(i*2+1).widget().setStyleSheet("font-size: 14px; color: #2e86c1;")
+        self.class_label = QLabel()
+        self.class_label.setFont(QFont("Arial", 16, QFont.Bold))
+        self.class_label.setAlignment(Qt.AlignCenter)
+        self.class_label.setObjectName("classification")
+        layout.addWidget(self.class_label)
+
+        # Probabilities (stili dalle regole QLabel[class=...] del foglio principale)
+        self.ai_prob_label = QLabel()
+        self.human_prob_label = QLabel()
+        prob_layout = QFormLayout()
+        for caption, value_label in (("🤖 AI Probability:", self.ai_prob_label),
+                                     ("👤 Human Probability:", self.human_prob_label)):
+            caption_label = QLabel(caption)
+            caption_label.setProperty("class", "probKey")
+            value_label.setProperty("class", "probValue")
+            prob_layout.addRow(caption_label, value_label)
 
         layout.addLayout(prob_layout)
 
-        self.results_layout.addWidget(card)
+        return card
 
-    def _create_confidence_card(self, result: AnalysisResult):
+    def _create_confidence_card(self) -> QGroupBox:
         """Crea card confidenza"""
         card = QGroupBox("🎯 CONFIDENCE METRICS")
-        card.setStyleSheet(self._get_group_style("#28a745"))
+        card.setProperty("accent", "green")
 
         layout = QVBoxLayout(card)
 
-        certainty_label = QLabel(f"✨ Certainty: {result.certainty_level}")
-        certainty_label.setFont(QFont("Arial", 14, QFont.Bold))
-        certainty_label.setStyleSheet("color: #28a745;")
-        layout.addWidget(certainty_label)
+        self.certainty_label = QLabel()
+        self.certainty_label.setFont(QFont("Arial", 14, QFont.Bold))
+        self.certainty_label.setObjectName("certainty")
+        layout.addWidget(self.certainty_label)
 
-        confidence_label = QLabel(f"📊 Confidence Score: {result.confidence:.4f}")
-        confidence_label.setStyleSheet("font-size: 13px;")
-        layout.addWidget(confidence_label)
+        self.confidence_label = QLabel()
+        self.confidence_label.setObjectName("confScore")
+        layout.addWidget(self.confidence_label)
 
-        recommendation_label = QLabel(f"💡 {result.recommendation}")
-        recommendation_label.setWordWrap(True)
-        recommendation_label.setStyleSheet("""
-            font-size: 12px;
-            color: #666;
-            padding: 8px;
-            background-color: #f8f9fa;
-            border-radius: 4px;
-        """)
-        layout.addWidget(recommendation_label)
+        self.recommendation_label = QLabel()
+        self.recommendation_label.setWordWrap(True)
+        self.recommendation_label.setObjectName("recommendation")
+        layout.addWidget(self.recommendation_label)
 
-        self.results_layout.addWidget(card)
+        return card
 
-    def _create_analyzers_card(self, result: AnalysisResult):
+    def _create_analyzers_card(self) -> QGroupBox:
         """Crea card analyzers individuali"""
         card = QGroupBox("👥 ANALIZZATORI INDIVIDUALI")
-        card.setStyleSheet(self._get_group_style("#6f42c1"))
+        card.setProperty("accent", "purple")
 
-        layout = QVBoxLayout(card)
+        # Le label per analyzer sono create alla prima necessità e riusate
+        self.analyzers_layout = QVBoxLayout(card)
+        self.analyzer_labels = []
 
+        return card
+
+    def _update_analyzers_card(self, result: "AnalysisResult"):
+        """Aggiorna card analyzers individuali riusando le label esistenti"""
+        lines = []
         for name, data in result.individual_results.items():
             if isinstance(data, dict) and 'ai_probability' in data:
                 ai_prob = data['ai_probability']
                 conf = data.get('confidence', 0)
-                analyzer_label = QLabel(f"🔹 {name}: AI={ai_prob:.3f}, Conf={conf:.3f}")
-                analyzer_label.setStyleSheet("font-size: 12px; padding: 2px;")
-                layout.addWidget(analyzer_label)
-
-        self.results_layout.addWidget(card)
-
-    def _create_system_card(self, result: AnalysisResult):
+                lines.append(f"🔹 {name}: AI={ai_prob:.3f}, Conf={conf:.3f}")
+
+        while len(self.analyzer_labels) < len(lines):
+            analyzer_label = QLabel()
+            analyzer_label.setObjectName("analyzerRow")
+            self.analyzers_layout.addWidget(analyzer_label)
+            self.analyzer_labels.append(analyzer_label)
+
+        for i, analyzer_label in enumerate(self.analyzer_labels):
+            if i < len(lines):
+                analyzer_label.setText(lines[i])
+                analyzer_label.setVisible(True)
+            else:
+                analyzer_label.setVisible(False)
+
+    def _create_system_card(self) -> QGroupBox:
         """Crea card informazioni sistema"""
         card = QGroupBox("⚙️ SYSTEM INFO")
-        card.setStyleSheet(self._get_group_style("#607d8b"))
+        card.setProperty("accent", "grey")
 
         layout = QVBoxLayout(card)
 
-        time_label = QLabel(f"⏱️ Processing Time: {result.processing_time_ms:.2f}ms")
-        time_label.setStyleSheet("font-size: 12px;")
-        layout.addWidget(time_label)
+        self.time_label = QLabel()
+        self.time_label.setObjectName("processingTime")
+        layout.addWidget(self.time_label)
 
-        timestamp_label = QLabel(f"🕐 Timestamp: {result.timestamp[:19]}")
-        timestamp_label.setStyleSheet("font-size: 11px; color: #666;")
-        layout.addWidget(timestamp_label)
+        self.timestamp_label = QLabel()
+        self.timestamp_label.setObjectName("timestamp")
+        layout.addWidget(self.timestamp_label)
 
-        self.results_layout.addWidget(card)
+        return card
 
     def _export_results(self):
         """Esporta risultati"""
         if not self.analysis_result:
             return
 
-        filepath, _ = QFileDialog.getSaveFileName(
+        filepath, selected_filter = QFileDialog.getSaveFileName(
             self,
             "Esporta Risultati",
             f"analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-            "JSON Files (*.json)"
+            f"{self.EXPORT_FILTER_JSON};;{self.EXPORT_FILTER_GZIP}"
         )
 
         if filepath:
             try:
-                self.analyzer.export_result(self.analysis_result, filepath)
+                # Filtro compresso: gzip forzato; altrimenti decide la dimensione
+                compress = True if selected_filter == self.EXPORT_FILTER_GZIP else None
+                filepath = self.analyzer.export_result(self.analysis_result, filepath,
+                                                       compress=compress)
                 QMessageBox.information(self, "Successo", f"Risultati salvati in:\n{filepath}")
-                self.status_bar.showMessage(f"Risultati esportati: {filepath}")
+                self._queue_status(f"Risultati esportati: {filepath}")
             except Exception as e:
                 QMessageBox.critical(self, "Errore", f"Errore nell'esportazione:\n{str(e)}")
 
     def _show_welcome_message(self):
         """Mostra messaggio di benvenuto"""
-        self.status_bar.showMessage(
-            "Welcome! Inserisci un testo e clicca '🧠 Analisi Avanzata' per iniziare"
-        )
+        self._queue_status(self.STATUS_WELCOME)
 
     def _show_help(self):
-        """Mostra dialog di aiuto"""
-        QMessageBox.information(
-            self,
-            "Aiuto - TextAnalyzer v3.0",
-            """🧠 TextAnalyzer - Ensemble AI Detection
-
-COMANDI:
-• 🔍 Analisi Standard: Analisi base con ensemble
-• 🧠 Analisi Avanzata: Analisi completa con confidence metrics
-
-ANalyzers UTILIZZATI:
-1. LexicalAnalyzer - Metriche lessicali (TTR, Burstiness)
-2. SyntacticAnalyzer - Variabilità frasi, pattern
-3. SemanticAnalyzer - Coerenza, densità concettuale
-4. StylisticAnalyzer - Punteggiatura, maiuscole
-5. MLAnalyzer - Entropia, transizioni, ML proxy
-
-CLASSIFICAZIONE:
-• AI Probability > 0.6: Probabilmente AI
-• AI Probability < 0.4: Probabilmente Umano
-• 0.4-0.6: Indeterminato
-
-Per calibrazione automatica, usa il comando:
-python3 core/text_analyzer.py --calibrate
-
-Per ulteriori info, vedi CLAUDE.md"""
-        )
+        """Mostra dialog di aiuto (creato al primo uso, poi solo riportato in primo piano)"""
+        if self._help_box is None:
+            self._help_box = QMessageBox(QMessageBox.Information, "Aiuto - TextAnalyzer v3.0",
+                                         self.HELP_TEXT, QMessageBox.Ok, self)
+            self._help_box.setWindowModality(Qt.NonModal)
+        self._help_box.show()
+        self._help_box.raise_()
+        self._help_box.activateWindow()
 
 
 def main():
@@ -7,7 +7,7 @@ Entry point per avviare l'interfaccia grafica
 
 import sys
 import os
-sys.path.insert(0, '/home/martina/PycharmProjects/TextAnalyzer')
+import importlib.util
 
 from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtCore import Qt
@@ -16,32 +16,41 @@ from PySide6.QtGui import QIcon, QPixmap
 from gui.main_window import TextAnalyzerGUI
 
 
-def check_dependencies():
-    """Verifica che tutte le dipendenze siano installate"""
-    missing = []
+STARTUP_MESSAGE = """🧠 Benvenuto in TextAnalyzer!
 
-    # Check PySide6
-    try:
-        import PySide6
-    except ImportError:
-        missing.append("PySide6")
+Ensemble AI Detection System
+• 5 Analyzers Specializzati
+• Confidence Metrics
+• Calibrated System
 
-    # Check core dependencies
-    try:
-        import numpy
-        import scipy
-        from sklearn import metrics
-    except ImportError as e:
-        missing.append(str(e).split("'")[1] if "'" in str(e) else "scipy/sklearn")
+Inserisci un testo e clicca '🧠 Analisi Avanzata' per iniziare!
 
-    # Check analyzers
-    try:
-        from analyzers import list_available_analyzers
-        analyzers = list_available_analyzers()
-        if len(analyzers) < 5:
-            missing.append(f"Missing analyzers (found {len(analyzers)}, need 5)")
-    except Exception as e:
-        missing.append(f"Analyzers error: {str(e)}")
+Per supporto, vedi CLAUDE.md"""
+
+# Moduli richiesti all'avvio: verificati con find_spec, senza importarli
+REQUIRED_MODULES = ("PySide6", "numpy", "scipy", "sklearn")
+
+
+def check_dependencies(strict: bool = False):
+    """Verifica che tutte le dipendenze siano installate.
+
+    find_spec interroga solo i finder: numpy/scipy/sklearn non vengono
+    inizializzati qui ma al primo uso del motore (warm-up della finestra).
+    Anche gli analyzers sono caricati solo allora; eventuali errori
+    compaiono alla prima analisi. Con strict=True (--strict) il registry
+    degli analyzers viene importato e verificato subito.
+    """
+    missing = [name for name in REQUIRED_MODULES
+               if importlib.util.find_spec(name) is None]
+
+    if strict and not missing:
+        try:
+            from analyzers import list_available_analyzers
+            analyzers = list_available_analyzers()
+            if len(analyzers) < 5:
+                missing.append(f"Missing analyzers (found {len(analyzers)}, need 5)")
+        except Exception as e:
+            missing.append(f"Analyzers error: {str(e)}")
 
     return missing
 
@@ -54,10 +63,6 @@ def setup_application(app: QApplication):
     app.setOrganizationName("TextAnalyzer Project")
     app.setOrganizationDomain("textanalyzer.local")
 
-    # High DPI support
-    app.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    app.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
-
     # Load styles
     style = """
         QApplication {
@@ -67,26 +72,24 @@ def setup_application(app: QApplication):
     app.setStyleSheet(style)
 
 
-def show_startup_message():
-    """Mostra messaggio di avvio"""
-    return QMessageBox.information(
-        None,
-        "TextAnalyzer v3.0",
-        """🧠 Benvenuto in TextAnalyzer!
-
-Ensemble AI Detection System
-• 5 Analyzers Specializzati
-• Confidence Metrics
-• Calibrated System
-
-Inserisci un testo e clicca '🧠 Analisi Avanzata' per iniziare!
-
-Per supporto, vedi CLAUDE.md"""
-    )
-
+def show_startup_message(parent=None) -> QMessageBox:
+    """Mostra messaggio di avvio (non modale: la finestra resta utilizzabile)"""
+    box = QMessageBox(QMessageBox.Information, "TextAnalyzer v3.0", STARTUP_MESSAGE,
+                      QMessageBox.Ok, parent)
+    box.setWindowModality(Qt.NonModal)
+    box.setAttribute(Qt.WA_DeleteOnClose)
+    box.show()
+    return box
 
 def main():
     """Main entry point per GUI"""
+    # High DPI: in Qt6 lo scaling è sempre attivo (AA_EnableHighDpiScaling e
+    # AA_UseHighDpiPixmaps sono deprecati e ignorati); la policy di
+    # arrotondamento va impostata prima di creare la QApplication
+    QApplication.setHighDpiScaleFactorRoundingPolicy(
+        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+    )
+
     # Create QApplication
     app = QApplication(sys.argv)
 
@@ -95,7 +98,7 @@ def main():
 
     # Check dependencies
     print("🔍 Checking dependencies...")
-    missing = check_dependencies()
+    missing = check_dependencies(strict="--strict" in sys.argv)
 
     if missing:
         error_msg = "❌ Missing dependencies:\n\n" + "\n".join(f"• {m}" for m in missing)
@@ -105,17 +108,17 @@ def main():
 
     print("✅ All dependencies OK")
 
-    # Show startup message
-    try:
-        show_startup_message()
-    except:
-        pass  # Ignore if dialog fails
-
     # Create and show window
     print("🖥️ Starting GUI...")
     window = TextAnalyzerGUI()
     window.show()
 
+    # Show startup message (sopra la finestra, senza bloccarne la comparsa)
+    try:
+        show_startup_message(window)
+    except:
+        pass  # Ignore if dialog fails
+
     print("✅ TextAnalyzer GUI started!")
     print("   Window size: 1400x900")
     print("   Analyzers: 5")
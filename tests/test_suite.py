@@ -6,8 +6,11 @@ Suite di test per verificare il corretto funzionamento del sistema
 
 import unittest
 import os
+import re
 import sys
+import subprocess
 import tempfile
+from datetime import datetime
 from unittest.mock import patch
 
 # Aggiungi il path del progetto
@@ -16,7 +19,30 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.text_processor import TextProcessor
 from features.feature_extractor import FeatureExtractor
 from core.analyzer import TextAnalyzer
+from utils import data_loader
 from utils.data_loader import DataLoader
+from utils.result_cache import ResultCache
+from utils.worker_pool import init_worker_analyzer, get_worker_analyzer
+from utils.text_utils import split_sentences
+from utils.grading import band
+
+try:
+    from utils.confidence_metrics import ConfidenceMetrics
+except ImportError:  # richiede numpy e scipy
+    ConfidenceMetrics = None
+
+try:
+    import core.text_analyzer as engine
+except ImportError:  # motore ensemble: richiede numpy
+    engine = None
+
+import cli
+
+
+def _clear_analyzer_caches(analyzer):
+    """Svuota le cache dei TextProcessor di un analyzer condiviso tra i test"""
+    analyzer.text_processor.clear_cache()
+    analyzer.feature_extractor.text_processor.clear_cache()
 
 
 class TestTextProcessor(unittest.TestCase):
@@ -55,12 +81,44 @@ class TestTextProcessor(unittest.TestCase):
         self.assertIn('sentence_count', stats)
         self.assertGreater(stats['word_count'], 0)
 
+    def test_shared_sentence_splitter(self):
+        """Test splitter condiviso equivalente a re.split senza frammenti vuoti"""
+        for text in ["Prima frase. Seconda frase!! Terza?", "Perché sì... Già!", "  ", "Senza punto"]:
+            expected = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
+            self.assertEqual(split_sentences(text), expected)
+
+    def test_input_validator_does_not_import_analyzers(self):
+        """Test InputValidator importabile senza analyzers (e quindi senza numpy)"""
+        code = "import sys, utils.input_validator; sys.exit('analyzers' in sys.modules)"
+        project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(subprocess.run([sys.executable, "-c", code], cwd=project_dir).returncode, 0)
+
+    def test_tokenize_cache_keeps_long_document(self):
+        """Test cache di tokenize su un documento lungo (oltre 128 frasi)"""
+        extractor = FeatureExtractor()
+        processor = extractor.text_processor
+        text = " ".join(f"Questa è la frase numero {i} del documento lungo." for i in range(300))
+
+        extractor.extract_all_features(text)
+        info = processor._tokenize_cached.cache_info()
+        self.assertLessEqual(info.currsize, TextProcessor.CACHE_MAX_DOCUMENTS)
+
+        # Le frasi non sfrattano il documento: la chiamata successiva è un hit
+        processor.tokenize(text)
+        self.assertEqual(processor._tokenize_cached.cache_info().hits, info.hits + 1)
+
 
 class TestFeatureExtractor(unittest.TestCase):
     """Test per il FeatureExtractor"""
     
+    @classmethod
+    def setUpClass(cls):
+        # Un extractor per tutta la classe: la cache di tokenize/split_sentences
+        # del suo TextProcessor viene svuotata prima di ogni test
+        cls.extractor = FeatureExtractor()
+    
     def setUp(self):
-        self.extractor = FeatureExtractor()
+        self.extractor.text_processor.clear_cache()
     
     def test_extract_lexical_features(self):
         """Test estrazione features lessicali"""
@@ -110,6 +168,50 @@ class TestFeatureExtractor(unittest.TestCase):
         self.assertIn('style', all_features)
         self.assertIn('semantic', all_features)
         self.assertIn('all_features', all_features)
+    
+    def test_gulpease_index(self):
+        """Test indice Gulpease"""
+        text = "Il gatto dorme sul divano. Oggi il cielo è molto sereno e luminoso."
+        features = self.extractor.extract_readability_features(text)
+        
+        # 13 parole, 2 frasi, 53 lettere: 89 + (300*2 - 10*53) / 13
+        self.assertAlmostEqual(features['gulpease_index'], 89 + 70 / 13, places=6)
+        self.assertEqual(self.extractor.extract_readability_features("")['gulpease_index'], 0.0)
+
+    def test_letter_count_matches_isalpha(self):
+        """Test conteggio lettere identico a str.isalpha (apici e frazioni esclusi)"""
+        text = "Il gatto dorme sul divano². Oggi il cielo è ½ molto sereno e luminoso."
+        features = self.extractor.extract_readability_features(text)
+
+        # Come sopra con una parola in più: '²' e '½' non sono lettere
+        self.assertAlmostEqual(features['gulpease_index'], 89 + (600 - 530) / 14, places=6)
+
+    def test_short_text_skips_smog_and_fog(self):
+        """Test SMOG e Gunning Fog nulli sotto le soglie di validità"""
+        text = "Le tecnologie informatiche contemporanee rivoluzionano la comunicazione. Ovviamente."
+        features = self.extractor.extract_readability_features(text)
+        
+        self.assertEqual(features['smog_index'], 0.0)
+        self.assertEqual(features['gunning_fog_index'], 0.0)
+        self.assertGreater(features['flesch_kincaid_grade'], 0)
+    
+    def test_subordination_ratio_is_stable_on_accented_input(self):
+        """Test rapporto di subordinazione invariato su indicatori accentati"""
+        text = ("Benché piova, esco. Dato che è tardi, vado. "
+                "Poiché sei qui, resta. Mentre mangio leggo il giornale.")
+        features = self.extractor.extract_readability_features(text)
+        
+        # Solo 'mentre' corrisponde a un token: 1 frase su 4
+        self.assertAlmostEqual(features['subordination_ratio'], 0.25)
+    
+    def test_gunning_fog_threshold_uses_full_word_count(self):
+        """Test soglia di Gunning Fog sulle parole del testo, non sui token filtrati"""
+        sentence = "Le tecnologie informatiche contemporanee rivoluzionano la comunicazione quotidiana. "
+        below = self.extractor.extract_readability_features(sentence * 12)  # 96 parole
+        above = self.extractor.extract_readability_features(sentence * 13)  # 104 parole
+        
+        self.assertEqual(below['gunning_fog_index'], 0.0)
+        self.assertGreater(above['gunning_fog_index'], 0.0)
 
 
 class TestDataLoader(unittest.TestCase):
@@ -148,13 +250,113 @@ class TestDataLoader(unittest.TestCase):
         validation = self.loader.validate_file(self.temp_file)
         self.assertTrue(validation['valid'])
         self.assertIn('file_info', validation)
+    
+    def test_save_result_same_content_with_and_without_orjson(self):
+        """Test risultato salvato identico (una volta ricaricato) con json e orjson"""
+        result = {
+            'final_assessment': {'prediction': 'AI', 'confidence': 0.875},
+            'counts': {1: 2, 'parole': 3},
+            'timestamp': datetime(2026, 1, 2, 3, 4, 5),
+            'text': 'perché sì',
+        }
+        expected = {
+            'final_assessment': {'prediction': 'AI', 'confidence': 0.875},
+            'counts': {'1': 2, 'parole': 3},
+            'timestamp': '2026-01-02 03:04:05',
+            'text': 'perché sì',
+        }
+        
+        backends = [None]
+        if data_loader.orjson is not None:
+            backends.append(data_loader.orjson)
+        
+        for i, backend in enumerate(backends):
+            output_path = os.path.join(self.temp_dir, f"result_{i}.json")
+            with patch.object(data_loader, 'orjson', backend):
+                self.loader.save_analysis_result(result, output_path)
+            try:
+                self.assertEqual(self.loader.load_analysis_result(output_path), expected)
+            finally:
+                os.remove(output_path)
+
+
+class TestResultCache(unittest.TestCase):
+    """Test per la cache persistente dei risultati"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = ResultCache(os.path.join(self.temp_dir, "results.sqlite"))
+    
+    def tearDown(self):
+        self.cache.close()
+        os.remove(self.cache.path)
+        os.rmdir(self.temp_dir)
+    
+    def test_roundtrip_and_version(self):
+        """Test salvataggio, rilettura e invalidazione per versione"""
+        data = {'classification': 'Probabilmente AI', 'ai_probability': 0.8}
+        self.cache.put("abc", "v1", data)
+        self.assertEqual(self.cache.get("abc", "v1"), data)
+        self.assertIsNone(self.cache.get("abc", "v2"))
+        self.assertIsNone(self.cache.get("missing", "v1"))
+
+    def test_corrupt_row_is_a_miss_and_removed(self):
+        """Test voce corrotta trattata come assente ed eliminata"""
+        with self.cache._lock:
+            self.cache._conn.execute(
+                "INSERT INTO results (hash, version, json, created) VALUES (?, ?, ?, ?)",
+                ("abc", "v1", "{non json", 0.0)
+            )
+        self.assertIsNone(self.cache.get("abc", "v1"))
+
+        # La riga corrotta è stata rimossa dal database
+        count = self.cache._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        self.assertEqual(count, 0)
+
+
+class TestGrading(unittest.TestCase):
+    """Test per le fasce di punteggio condivise (affidabilità, AUC)"""
+
+    def test_band_edges_and_nan(self):
+        """Test soglie incluse nella fascia superiore e NaN nella più bassa"""
+        cuts, labels = (0.5, 0.8), ("bassa", "media", "alta")
+        self.assertEqual(band(0.49, cuts, labels), "bassa")
+        self.assertEqual(band(0.5, cuts, labels), "media")
+        self.assertEqual(band(0.8, cuts, labels), "alta")
+        self.assertEqual(band(float('nan'), cuts, labels), "bassa")
+
+
+@unittest.skipIf(ConfidenceMetrics is None, "numpy/scipy non installati")
+class TestConfidenceMetrics(unittest.TestCase):
+    """Test per le fasce di ConfidenceMetrics"""
+    
+    def setUp(self):
+        self.metrics = ConfidenceMetrics()
+    
+    def test_reliability_bands(self):
+        """Test soglie incluse nelle fasce di affidabilità"""
+        self.assertEqual(self.metrics._grade_reliability(0.9), "A+ (Eccellente)")
+        self.assertEqual(self.metrics._grade_reliability(0.49), "D (Insufficiente)")
+        self.assertTrue(self.metrics._get_reliability_recommendation(0.8).startswith("Modello molto"))
+    
+    def test_nan_score_gets_lowest_band(self):
+        """Test score NaN classificato nella fascia più bassa"""
+        nan = float('nan')
+        self.assertEqual(self.metrics._grade_reliability(nan), "D (Insufficiente)")
+        self.assertEqual(self.metrics._get_reliability_recommendation(nan),
+                         ConfidenceMetrics.RELIABILITY_ADVICE[0])
 
 
 class TestAnalyzer(unittest.TestCase):
     """Test per l'Analyzer principale"""
     
+    @classmethod
+    def setUpClass(cls):
+        # Costruzione costosa (processor, extractor, modello): una per classe
+        cls.analyzer = TextAnalyzer()
+    
     def setUp(self):
-        self.analyzer = TextAnalyzer()
+        _clear_analyzer_caches(self.analyzer)
         
         # Crea file temporanei
         self.temp_dir = tempfile.mkdtemp()
@@ -212,7 +414,24 @@ class TestAnalyzer(unittest.TestCase):
         for result in results:
             self.assertNotIn('error', result)
             self.assertIn('final_assessment', result)
-    
+
+    def test_batch_analyze_multiprocess_matches_serial(self):
+        """Test batch su pool di processi: stessi risultati e stesso ordine del seriale"""
+        serial = self.analyzer.batch_analyze(self.temp_dir, "*.txt", processes=1)
+        parallel = self.analyzer.batch_analyze(self.temp_dir, "*.txt", processes=2)
+
+        self.assertEqual([r['file_path'] for r in parallel], [r['file_path'] for r in serial])
+        self.assertEqual([r['final_assessment'] for r in parallel],
+                         [r['final_assessment'] for r in serial])
+
+    def test_batch_worker_inherits_configuration(self):
+        """Test worker batch configurato come l'analyzer del processo padre"""
+        patterns = {'ai_indicators': {'custom': 0.1}, 'human_indicators': {}}
+        with patch.object(self.analyzer, 'known_patterns', patterns):
+            init_worker_analyzer(TextAnalyzer, None, self.analyzer._batch_worker_state())
+
+        self.assertEqual(get_worker_analyzer().known_patterns, patterns)
+
     def test_confidence_calculation(self):
         """Test calcolo confidence"""
         text = "Questo è un test con parole diverse e variegate che dovrebbe avere alta diversità lessicale."
@@ -223,11 +442,53 @@ class TestAnalyzer(unittest.TestCase):
         self.assertLessEqual(confidence, 1)
 
 
+class TestCLIBatch(unittest.TestCase):
+    """Test per l'analisi batch della CLI (worker multiprocesso)"""
+
+    def test_batch_stats_from_worker_results(self):
+        """Test statistiche batch calcolate dai risultati dei worker"""
+        results = [{'processing_time_ms': 10.0, 'confidence': 0.5},
+                   {'processing_time_ms': 30.0, 'confidence': 0.9}]
+        stats = cli._batch_stats({'total_analyses': 0, 'is_calibrated': False},
+                                 results, {101: 1, 102: 1})
+
+        self.assertEqual(stats['total_analyses'], 2)
+        self.assertAlmostEqual(stats['avg_processing_time'], 20.0)
+        self.assertAlmostEqual(stats['avg_confidence'], 0.7)
+        self.assertEqual(stats['cache_size'], 2)
+        self.assertFalse(stats['is_calibrated'])
+
+    @unittest.skipIf(engine is None, "numpy non installato")
+    def test_batch_export_reports_all_analyses(self):
+        """Test export batch: total_analyses pari al numero di file"""
+        import json
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            texts = ["Il gatto dorme sul divano. Oggi il cielo è molto sereno e luminoso.",
+                     "Beh, non so se è proprio così. Ieri parlavo con mio fratello di tecnologia."]
+            for i, text in enumerate(texts):
+                with open(os.path.join(temp_dir, f"testo_{i}.txt"), 'w', encoding='utf-8') as f:
+                    f.write(text)
+            output = os.path.join(temp_dir, "out", "batch.json")
+
+            self.assertEqual(cli.batch_analyze(temp_dir, output), 0)
+            with open(output, encoding='utf-8') as f:
+                exported = json.load(f)
+
+        self.assertEqual(exported['timestamp']['total_analyses'], len(texts))
+        self.assertEqual(len(exported['results']), len(texts))
+        self.assertGreater(exported['timestamp']['avg_processing_time'], 0)
+
+
 class TestIntegration(unittest.TestCase):
     """Test di integrazione del sistema completo"""
     
+    @classmethod
+    def setUpClass(cls):
+        cls.analyzer = TextAnalyzer()
+    
     def setUp(self):
-        self.analyzer = TextAnalyzer()
+        _clear_analyzer_caches(self.analyzer)
         self.loader = DataLoader()
         
         # Crea directory di test
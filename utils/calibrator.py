@@ -373,9 +373,7 @@ class EnsembleCalibrator:
 
 # Test
 if __name__ == "__main__":
-    import sys
-    sys.path.insert(0, '/home/martina/PycharmProjects/TextAnalyzer')
-
+    # Eseguire dalla root del progetto: python3 -m utils.calibrator
     from core.ensemble_analyzer import EnsembleAnalyzer
 
     # Crea ensemble
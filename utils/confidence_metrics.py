@@ -8,16 +8,34 @@ Include: Intervalli di confidenza, Bootstrap, Bayesian Inference, Uncertainty Qu
 
 import numpy as np
 import statistics
+from bisect import bisect_left
 from typing import Dict, List, Any, Tuple, Optional
 from datetime import datetime
 import json
 import os
 from scipy import stats
 
+from utils.grading import band
+
 
 class ConfidenceMetrics:
     """Calcolo metriche di confidenza avanzate"""
 
+    # Soglie ordinate e relative etichette (una in più delle soglie):
+    # la fascia si trova con una ricerca binaria invece di catene if/elif
+    CERTAINTY_CUTS = (0.2, 0.4, 0.6, 0.8)
+    CERTAINTY_LABELS = ("Molto Bassa", "Bassa", "Media", "Alta", "Molto Alta")
+    RELIABILITY_GRADE_CUTS = (0.5, 0.6, 0.7, 0.8, 0.9)
+    RELIABILITY_GRADES = ("D (Insufficiente)", "C (Sufficiente)", "B (Discreto)",
+                          "B+ (Buono)", "A (Molto Buono)", "A+ (Eccellente)")
+    RELIABILITY_ADVICE_CUTS = (0.4, 0.6, 0.8)
+    RELIABILITY_ADVICE = (
+        "Affidabilità bassa. Si raccomanda revisione del modello.",
+        "Affidabilità moderata. Considera miglioramenti o validazione aggiuntiva.",
+        "Modello affidabile. Adatto per la maggior parte delle applicazioni.",
+        "Modello molto affidabile. Può essere usato per decisioni critiche.",
+    )
+
     def __init__(self):
         self.name = "ConfidenceMetrics"
 
@@ -262,17 +280,9 @@ class ConfidenceMetrics:
         # Incertezza specifica (0-1, più alto = più certo)
         prediction_certainty = 1.0 - total_uncertainty
 
-        # Classificazione incertezza
-        if prediction_certainty > 0.8:
-            certainty_level = "Molto Alta"
-        elif prediction_certainty > 0.6:
-            certainty_level = "Alta"
-        elif prediction_certainty > 0.4:
-            certainty_level = "Media"
-        elif prediction_certainty > 0.2:
-            certainty_level = "Bassa"
-        else:
-            certainty_level = "Molto Bassa"
+        # Classificazione incertezza (soglie esclusive: > 0.8 -> "Molto Alta")
+        certainty_level = self.CERTAINTY_LABELS[
+            bisect_left(self.CERTAINTY_CUTS, prediction_certainty)]
 
         return {
             'prediction_certainty': round(prediction_certainty, 4),
@@ -371,29 +381,11 @@ class ConfidenceMetrics:
 
     def _grade_reliability(self, score: float) -> str:
         """Converte score in voto letterale"""
-        if score >= 0.9:
-            return "A+ (Eccellente)"
-        elif score >= 0.8:
-            return "A (Molto Buono)"
-        elif score >= 0.7:
-            return "B+ (Buono)"
-        elif score >= 0.6:
-            return "B (Discreto)"
-        elif score >= 0.5:
-            return "C (Sufficiente)"
-        else:
-            return "D (Insufficiente)"
+        return band(score, self.RELIABILITY_GRADE_CUTS, self.RELIABILITY_GRADES)
 
     def _get_reliability_recommendation(self, score: float) -> str:
         """Raccomandazione basata su affidabilità"""
-        if score >= 0.8:
-            return "Modello molto affidabile. Può essere usato per decisioni critiche."
-        elif score >= 0.6:
-            return "Modello affidabile. Adatto per la maggior parte delle applicazioni."
-        elif score >= 0.4:
-            return "Affidabilità moderata. Considera miglioramenti o validazione aggiuntiva."
-        else:
-            return "Affidabilità bassa. Si raccomanda revisione del modello."
+        return band(score, self.RELIABILITY_ADVICE_CUTS, self.RELIABILITY_ADVICE)
 
     def export_confidence_report(self, results: Dict[str, Any],
                                filename: str = "confidence_report.json"):
@@ -10,6 +10,35 @@ import json
 from typing import List, Dict, Any
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_default(value: Any) -> Any:
+    """Converte scalari/array numpy in tipi JSON nativi, il resto in stringa"""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return str(value)
+
+
+def dumps_json(data: Any) -> bytes:
+    """Serializza un risultato in JSON UTF-8 indentato
+    
+    Con orjson (encoder C) o, in sua assenza, con json: i due percorsi
+    producono lo stesso contenuto una volta ricaricato. Date e dataclass
+    passano da json_default anche con orjson, come farebbe json.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=json_default,
+            option=(orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+        )
+    return json.dumps(data, indent=2, ensure_ascii=False, default=json_default).encode('utf-8')
+
 
 class DataLoader:
     """Utility per caricamento e gestione dati"""
@@ -17,6 +46,8 @@ class DataLoader:
     def __init__(self):
         self.supported_extensions = ['.txt', '.md', '.json']
         self.max_file_size = 10 * 1024 * 1024  # 10MB
+        self.read_buffer_size = 1024 * 1024  # 1MB
+        self.write_buffer_size = 1024 * 1024  # 1MB
 
     def load_text_file(self, file_path: str) -> str:
         """Carica un file di testo"""
@@ -26,19 +57,23 @@ class DataLoader:
         if os.path.getsize(file_path) > self.max_file_size:
             raise ValueError(f"File troppo grande (max {self.max_file_size/1024/1024:.1f}MB)")
         
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return file.read()
-        except UnicodeDecodeError:
-            # Prova con encoding alternativi
-            encodings = ['latin-1', 'cp1252', 'iso-8859-1']
-            for encoding in encodings:
-                try:
-                    with open(file_path, 'r', encoding=encoding) as file:
-                        return file.read()
-                except UnicodeDecodeError:
-                    continue
-            raise ValueError(f"Impossibile decodificare il file: {file_path}")
+        # Una sola lettura in blocco con buffer ampio: i tentativi di
+        # decodifica lavorano in memoria senza rileggere il file
+        with open(file_path, 'rb', buffering=self.read_buffer_size) as file:
+            raw = file.read()
+        
+        # Prova utf-8, poi encoding alternativi
+        encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+        for encoding in encodings:
+            try:
+                text = raw.decode(encoding)
+            except UnicodeDecodeError:
+                continue
+            # Newline universali, come la lettura in modalità testo
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            return text
+        raise ValueError(f"Impossibile decodificare il file: {file_path}")
 
     def load_files_from_directory(self, directory: str, pattern: str = "*.txt") -> List[str]:
         """Carica tutti i file che corrispondono al pattern dalla directory"""
@@ -60,8 +95,10 @@ class DataLoader:
     def save_analysis_result(self, result: Dict[str, Any], output_path: str):
         """Salva il risultato dell'analisi in formato JSON"""
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False, default=str)
+            # Serializzazione completa in memoria, poi una sola write
+            payload = dumps_json(result)
+            with open(output_path, 'wb') as f:
+                f.write(payload)
         except Exception as e:
             raise ValueError(f"Errore nel salvataggio: {e}")
 
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Grading per TextAnalyzer
+Conversione di un punteggio nell'etichetta della sua fascia (voti, giudizi AUC)
+"""
+
+from bisect import bisect_right
+from typing import Sequence
+
+
+def band(value: float, cuts: Sequence[float], labels: Sequence[str]) -> str:
+    """
+    Etichetta della fascia di value, con ricerca binaria sulle soglie.
+
+    Args:
+        value: Punteggio da classificare
+        cuts: Soglie crescenti; una soglia appartiene alla fascia superiore
+        labels: Etichette delle fasce (len(cuts) + 1), dalla più bassa
+
+    Returns:
+        Etichetta della fascia; NaN ricade nella fascia più bassa
+    """
+    if value != value:
+        return labels[0]
+    return labels[bisect_right(cuts, value)]
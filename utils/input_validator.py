@@ -12,6 +12,9 @@ from typing import Dict, List, Any, Tuple, Optional
 from datetime import datetime
 import warnings
 
+from utils.text_utils import split_sentences
+
+
 class InputValidator:
     """
     Validatore di input con controlli multi-livello
@@ -28,6 +31,9 @@ class InputValidator:
         'excessive_punct': r'[.!?]{5,}',  # Troppi segni di punteggiatura
     }
 
+    # Sequenze di terminatori di frase (.!?)
+    TERMINATOR_RE = re.compile(r'[.!?]+')
+
     # Range accettabili per metriche
     VALIDATION_RANGES = {
         'min_length': 10,      # Minimo 10 parole
@@ -133,10 +139,12 @@ class InputValidator:
         elif word_count > self.VALIDATION_RANGES['max_length']:
             errors.append(f"Text too long: {word_count} words (max: {self.VALIDATION_RANGES['max_length']})")
 
-        # Controllo numero frasi
-        sentences = re.findall(r'[.!?]+', text)
-        sentence_count = len(sentences)
-        if sentence_count < self.VALIDATION_RANGES['min_sentences']:
+        # Controllo numero frasi: i terminatori contati con str.count sono un
+        # limite superiore delle frasi, il regex serve solo oltre 1 frase minima
+        min_sentences = self.VALIDATION_RANGES['min_sentences']
+        terminators = text.count('.') + text.count('!') + text.count('?')
+        if terminators < min_sentences or (
+                min_sentences > 1 and len(self.TERMINATOR_RE.findall(text)) < min_sentences):
             warnings.append(f"No clear sentence structure detected")
 
         return {'errors': errors, 'warnings': warnings}
@@ -195,8 +203,7 @@ class InputValidator:
         warnings = []
 
         words = text.split()
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = split_sentences(text)
 
         # Statistiche base
         word_count = len(words)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Result Cache per TextAnalyzer
+Cache persistente (SQLite) dei risultati di analisi tra sessioni diverse
+Chiave: hash del testo + versione del motore
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from typing import Dict, Any, Optional
+
+from utils.data_loader import json_default
+
+
+class ResultCache:
+    """
+    Memoizzazione persistente dei risultati su file SQLite.
+
+    Ogni errore di I/O disattiva la cache invece di propagarsi:
+    la cache non deve mai impedire un'analisi.
+    """
+
+    DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache",
+                                "textanalyzer", "results.sqlite")
+    MAX_AGE_DAYS = 30
+
+    def __init__(self, path: str = None):
+        self.path = path or self.DEFAULT_PATH
+        # La connessione è condivisa tra thread UI, warm-up e worker
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "hash TEXT PRIMARY KEY, version TEXT, json TEXT, created REAL)"
+            )
+            # Pulizia periodica delle voci scadute all'apertura
+            self._conn.execute(
+                "DELETE FROM results WHERE created < ?",
+                (time.time() - self.MAX_AGE_DAYS * 86400,)
+            )
+            self._conn.commit()
+        except (OSError, sqlite3.Error):
+            self._conn = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._conn is not None
+
+    def get(self, key: str, version: str) -> Optional[Dict[str, Any]]:
+        """Restituisce il risultato salvato per (key, version), se presente.
+
+        Una voce illeggibile (JSON corrotto) vale come assente e viene rimossa.
+        """
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT json FROM results WHERE hash = ? AND version = ?",
+                    (key, version)
+                ).fetchone()
+            return json.loads(row[0]) if row else None
+        except sqlite3.Error:
+            return None
+        except (ValueError, TypeError):
+            self.discard(key)
+            return None
+
+    def put(self, key: str, version: str, data: Dict[str, Any]):
+        """Salva (o sostituisce) il risultato per key"""
+        if self._conn is None:
+            return
+        payload = json.dumps(data, ensure_ascii=False, default=json_default)
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO results (hash, version, json, created) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, version, payload, time.time())
+                )
+                self._conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def discard(self, key: str):
+        """Elimina la voce di key (ad es. non più ricostruibile)"""
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM results WHERE hash = ?", (key,))
+                self._conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def clear(self):
+        """Elimina tutte le voci"""
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM results")
+                self._conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def close(self):
+        """Chiude la connessione"""
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+            self._conn = None
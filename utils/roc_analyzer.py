@@ -17,10 +17,19 @@ from datetime import datetime
 import json
 import os
 
+from utils.grading import band
+
 
 class ROCAnalyzer:
     """Analizzatore ROC per valutazione modelli AI detection"""
 
+    # Fasce di interpretazione: soglie crescenti (incluse) -> etichette
+    AUC_CUTS = (0.6, 0.7, 0.8, 0.9, 0.95)
+    AUC_LABELS = ("Molto scarso (Vicino al caso)", "Scarso", "Discreto",
+                  "Buono", "Ottimo", "Eccellente (Quasi perfetto)")
+    PR_AUC_CUTS = (0.6, 0.7, 0.8, 0.9)
+    PR_AUC_LABELS = ("Molto scarso", "Scarso", "Discreto", "Buono", "Eccellente")
+
     def __init__(self):
         self.name = "ROCAnalyzer"
         self.analysis_history = []
@@ -254,31 +263,11 @@ class ROCAnalyzer:
 
     def _interpret_auc(self, auc_value: float) -> str:
         """Interpreta valore AUC"""
-        if auc_value >= 0.95:
-            return "Eccellente (Quasi perfetto)"
-        elif auc_value >= 0.9:
-            return "Ottimo"
-        elif auc_value >= 0.8:
-            return "Buono"
-        elif auc_value >= 0.7:
-            return "Discreto"
-        elif auc_value >= 0.6:
-            return "Scarso"
-        else:
-            return "Molto scarso (Vicino al caso)"
+        return band(auc_value, self.AUC_CUTS, self.AUC_LABELS)
 
     def _interpret_pr_auc(self, pr_auc: float) -> str:
         """Interpreta PR AUC"""
-        if pr_auc >= 0.9:
-            return "Eccellente"
-        elif pr_auc >= 0.8:
-            return "Buono"
-        elif pr_auc >= 0.7:
-            return "Discreto"
-        elif pr_auc >= 0.6:
-            return "Scarso"
-        else:
-            return "Molto scarso"
+        return band(pr_auc, self.PR_AUC_CUTS, self.PR_AUC_LABELS)
 
     def _generate_recommendations(self, roc_auc: float, pr_auc: float,
                                 performance: Dict[str, Any]) -> List[str]:
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Text Utils per TextAnalyzer
+Funzioni di testo senza dipendenze esterne, condivise da analyzers,
+ensemble legacy e InputValidator
+"""
+
+import re
+from typing import List
+
+
+# Corpo di una frase: sequenza massimale senza terminatori (.!?)
+_SENTENCE_RE = re.compile(r'[^.!?]+')
+# Per testo ASCII: '!' e '?' diventano '.' e basta str.split in C
+_SENTENCE_TERMINATORS = str.maketrans('!?', '..')
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Frasi non vuote del testo, già ripulite dagli spazi.
+
+    Equivale a re.split(r'[.!?]+', text) senza i frammenti vuoti.
+    """
+    # Senza terminatori (controllo in C con str.count) il testo è una frase
+    if not (text.count('.') or text.count('!') or text.count('?')):
+        stripped = text.strip()
+        return [stripped] if stripped else []
+    # translate ha un percorso veloce solo per ASCII; altrimenti il regex è più rapido
+    if text.isascii():
+        parts = text.translate(_SENTENCE_TERMINATORS).split('.')
+        return [s for s in (p.strip() for p in parts) if s]
+    return [s for s in (m.group().strip() for m in _SENTENCE_RE.finditer(text)) if s]
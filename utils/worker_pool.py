@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Worker Pool per TextAnalyzer
+Analyzer per processo delle analisi batch multiprocesso (CLI e analyzer legacy)
+Funzioni a livello di modulo per essere serializzabili dal pool
+"""
+
+from typing import Any, Callable, Dict, Optional
+
+# Analyzer del processo worker (uno per processo)
+_worker_analyzer: Any = None
+
+
+def init_worker_analyzer(factory: Callable[..., Any],
+                         kwargs: Optional[Dict[str, Any]] = None,
+                         state: Optional[Dict[str, Any]] = None):
+    """
+    Initializer del pool: crea l'analyzer del worker.
+
+    Args:
+        factory: Classe (o funzione di modulo) che costruisce l'analyzer
+        kwargs: Argomenti del costruttore
+        state: Attributi da riportare dall'analyzer del processo padre
+            (calibrazione, pattern, modello), altrimenti persi nel worker
+    """
+    global _worker_analyzer
+    _worker_analyzer = factory(**(kwargs or {}))
+    if state:
+        vars(_worker_analyzer).update(state)
+
+
+def get_worker_analyzer() -> Any:
+    """Restituisce l'analyzer creato da init_worker_analyzer nel processo corrente"""
+    if _worker_analyzer is None:
+        raise RuntimeError("Worker non inizializzato: usare init_worker_analyzer come initializer")
+    return _worker_analyzer